@@ -0,0 +1,265 @@
+"""URL classifier — maps a result URL to its job board, company and job/non-job status.
+
+The host is parsed once and resolved against a domain-suffix index, so
+``boards.greenhouse.io`` and ``uk.linkedin.com`` both land on their board's
+rules without scanning a pattern list. Per-host path rules are compiled up
+front and the resolved rule is memoized per host.
+"""
+
+import re
+import logging
+from typing import Dict, NamedTuple, Optional, Pattern
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+# ── Host rules ────────────────────────────────────────────────────────────────
+# Keyed by registered domain. Each entry may set:
+#   source        — display name for the Source column
+#   blocked       — every URL on this domain is a non-job page
+#   job_path      — regex; paths NOT matching it are listing/category pages
+#   non_job_path  — regex; paths matching it are non-job pages
+#   company_path  — regex with a (?P<company>...) group pulled from the path
+HOST_RULES: Dict[str, Dict] = {
+    # ── Job boards ────────────────────────────────────────────────────────────
+    "linkedin.com": {
+        "source": "LinkedIn",
+        "non_job_path": r"^/(?:pulse|posts|learning|advice)/",
+        "company_path": r"^/jobs/view/[^/]+?-at-(?P<company>[a-z0-9-]+?)-\d+/?$",
+    },
+    "remoteok.com": {
+        "source": "RemoteOK",
+        "job_path": r"^/remote-jobs/",
+    },
+    "remoteok.io": {
+        "source": "RemoteOK",
+        "job_path": r"^/remote-jobs/",
+    },
+    "weworkremotely.com": {"source": "WeWorkRemotely"},
+    "euremotejobs.com": {"source": "EU Remote Jobs"},
+    "himalayas.app": {
+        "source": "Himalayas",
+        "company_path": r"^/companies/(?P<company>[^/]+)/jobs/",
+    },
+    "arc.dev": {"source": "Arc.dev"},
+    "wellfound.com": {
+        "source": "Wellfound",
+        "company_path": r"^/company/(?P<company>[^/]+)/jobs",
+    },
+    "angel.co": {
+        "source": "Wellfound",
+        "company_path": r"^/company/(?P<company>[^/]+)/jobs",
+    },
+    "indeed.com": {"source": "Indeed", "non_job_path": r"^/career"},
+    "glassdoor.com": {"source": "Glassdoor", "non_job_path": r"^/salar"},
+    "builtin.com": {"source": "Built In", "non_job_path": r"^/salar"},
+    "ziprecruiter.com": {"source": "ZipRecruiter", "non_job_path": r"^/salar"},
+    "ycombinator.com": {
+        "source": "YC Jobs",
+        "company_path": r"^/companies/(?P<company>[^/]+)/jobs",
+    },
+    "workatastartup.com": {"source": "YC Jobs"},
+    "news.ycombinator.com": {"blocked": True},  # Hacker News threads, not postings
+    # ── Applicant tracking systems (company slug is the first path segment) ──
+    "greenhouse.io": {
+        "source": "Greenhouse",
+        "company_path": r"^/(?P<company>[^/]+)/jobs/",
+    },
+    "lever.co": {
+        "source": "Lever",
+        "company_path": r"^/(?P<company>[^/]+)/[^/]+",
+    },
+    "ashbyhq.com": {
+        "source": "Ashby",
+        "company_path": r"^/(?P<company>[^/]+)/[^/]+",
+    },
+    "workable.com": {
+        "source": "Workable",
+        "company_path": r"^/(?P<company>[^/]+)/j/",
+    },
+    # ── Never job postings ───────────────────────────────────────────────────
+    "reddit.com": {"blocked": True},
+    "quora.com": {"blocked": True},
+    "medium.com": {"blocked": True},
+    "levels.fyi": {"blocked": True},
+    "payscale.com": {"blocked": True},
+    "wikipedia.org": {"blocked": True},
+    "udemy.com": {"blocked": True},     # courses, not jobs
+    "coursera.org": {"blocked": True},
+    "edx.org": {"blocked": True},
+    "omnis.partners": {"blocked": True},  # aggregator with known hybrid/remote mismatch
+}
+
+# Words that mark an article/tool page. Matched as whole URL tokens. On hosts
+# with no rules of their own the whole URL is checked; on known boards only
+# the first path segment ("/blog/...", "/salary/..."), so a posting slug
+# like ".../ml-engineer-newsroom-team" is not dropped.
+GENERIC_NON_JOB_TOKENS = frozenset({
+    "salary", "salaries", "calculator", "guide", "guides", "article",
+    "articles", "blog", "news", "compensation",
+})
+
+# Fallback company extraction from common title shapes:
+#   "Acme is hiring a Senior ML Engineer", "Senior ML Engineer - Acme is hiring"
+#   "Senior ML Engineer, Acme hiring now", "Senior ML Engineer at Acme - Remote"
+# A bare "X hiring" only counts after a separator. The name never spans a
+# " - ", "|", "—" or "," separator; an in-word hyphen ("Hugging-Face") is kept.
+TITLE_COMPANY_PATTERNS = [
+    re.compile(r"^(?!(?:we|now|still)\b)"
+               r"(?P<company>(?:(?!\s-\s)[^|–—:,])+?)\s+is\s+hiring\b",
+               re.IGNORECASE),
+    re.compile(r"(?:\s[-–—|]\s|,\s*)(?!(?:we|now|still)\b)"
+               r"(?P<company>(?:(?!\s-\s)[^|–—:,])+?)\s+(?:is\s+)?hiring\b",
+               re.IGNORECASE),
+    re.compile(r"\bat\s+(?P<company>[A-Z](?:(?!\s-\s)[^|–—(),])*?)"
+               r"\s*(?:$|\s-\s|[|–—(,])"),
+]
+
+# Title matches that are descriptions or roles, not company names ("at
+# Remote-first startup", "at Europe's fastest ML team", "Senior Engineer").
+# Board names are rejected separately.
+GENERIC_COMPANY_WORDS = frozenset({
+    "remote", "startup", "startups", "company", "companies", "job", "jobs",
+    "stealth", "hybrid", "team", "teams",
+    "engineer", "engineers", "engineering", "developer", "developers",
+    "senior", "junior", "staff", "principal", "lead", "head", "manager",
+    "scientist", "architect", "role", "position",
+})
+
+_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
+class UrlInfo(NamedTuple):
+    """Classification of a single result URL."""
+    host: str
+    source: str
+    company: str
+    is_job: bool
+
+
+class _HostRule(NamedTuple):
+    source: str
+    known: bool
+    blocked: bool
+    job_path: Optional[Pattern]
+    non_job_path: Optional[Pattern]
+    company_path: Optional[Pattern]
+
+
+_UNKNOWN_HOST = _HostRule("Web", False, False, None, None, None)
+
+
+def _compile_rule(rule: Dict) -> _HostRule:
+    def _re(key):
+        pattern = rule.get(key)
+        return re.compile(pattern, re.IGNORECASE) if pattern else None
+
+    return _HostRule(
+        source=rule.get("source", "Web"),
+        known=True,
+        blocked=rule.get("blocked", False),
+        job_path=_re("job_path"),
+        non_job_path=_re("non_job_path"),
+        company_path=_re("company_path"),
+    )
+
+
+def _humanize_slug(slug: str) -> str:
+    return " ".join(part.capitalize() for part in re.split(r"[-_]+", slug) if part)
+
+
+class UrlClassifier:
+    """Classifies result URLs by host using a compiled domain-suffix index."""
+
+    def __init__(self, host_rules: Dict[str, Dict] = None):
+        rules = HOST_RULES if host_rules is None else host_rules
+        self._index: Dict[str, _HostRule] = {
+            domain.lower(): _compile_rule(rule) for domain, rule in rules.items()
+        }
+        self._host_cache: Dict[str, _HostRule] = {}
+        # Board names a title fallback must not mistake for the employer
+        self._board_names = {r.source.lower() for r in self._index.values() if r.known}
+        self._board_names.update(domain.split(".")[0] for domain in self._index)
+
+    def rule_for_host(self, host: str) -> "_HostRule":
+        """Resolve a hostname to its rule via the longest matching domain suffix."""
+        cached = self._host_cache.get(host)
+        if cached is not None:
+            return cached
+
+        rule = _UNKNOWN_HOST
+        labels = host.split(".")
+        for i in range(len(labels) - 1):
+            found = self._index.get(".".join(labels[i:]))
+            if found is not None:
+                rule = found
+                break
+
+        self._host_cache[host] = rule
+        return rule
+
+    def classify(self, url: str, title: str = "") -> UrlInfo:
+        """Classify a URL; ``title`` is only used as a company-name fallback."""
+        try:
+            parts = urlsplit(url.strip())
+            host = (parts.hostname or "").lower()
+        except ValueError:
+            return UrlInfo("", "Web", "", False)
+
+        if host.startswith("www."):
+            host = host[4:]
+        path = parts.path or "/"
+        rule = self.rule_for_host(host)
+
+        return UrlInfo(
+            host=host,
+            source=rule.source,
+            company=self._company(rule, path, title),
+            is_job=self._is_job(rule, host, path),
+        )
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _is_job(rule: _HostRule, host: str, path: str) -> bool:
+        if rule.blocked:
+            return False
+        if rule.job_path and not rule.job_path.search(path):
+            return False
+        if rule.non_job_path and rule.non_job_path.search(path):
+            return False
+        if rule.company_path and rule.company_path.search(path):
+            return True  # ATS slugs are company names ("/news-corp/jobs/1")
+        if rule.known:
+            scope = path.lower().lstrip("/").split("/", 1)[0]
+        else:
+            scope = f"{host} {path.lower()}"
+        return not set(_TOKEN_SPLIT.split(scope)) & GENERIC_NON_JOB_TOKENS
+
+    def _company(self, rule: _HostRule, path: str, title: str) -> str:
+        if rule.company_path:
+            match = rule.company_path.search(path)
+            if match:
+                return _humanize_slug(match.group("company"))
+        for pattern in TITLE_COMPANY_PATTERNS:
+            match = pattern.search(title)
+            if match:
+                company = match.group("company").strip()
+                if self._plausible_company(company):
+                    return company
+        return ""  # better empty than a guess
+
+    def _plausible_company(self, name: str) -> bool:
+        lowered = name.lower()
+        if lowered in self._board_names:
+            return False
+        return not set(_TOKEN_SPLIT.split(lowered)) & GENERIC_COMPANY_WORDS
+
+
+_default = UrlClassifier()
+
+
+def classify_url(url: str, title: str = "") -> UrlInfo:
+    """Classify a URL with the default host rules."""
+    return _default.classify(url, title)
@@ -3,11 +3,13 @@
 import os
 from pathlib import Path
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# Only pay for importing python-dotenv when there is a .env file to read
+if Path(".env").exists() or (Path(__file__).resolve().parent.parent / ".env").exists():
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
 
 # ── API ──────────────────────────────────────────────────────────────────────
 BRAVE_API_KEY: str = os.getenv("BRAVE_API_KEY", "")
@@ -22,6 +24,13 @@ SHEET_OWNER_EMAIL: str = "jerzy.plocha@gmail.com"
 MAX_RESULTS_PER_QUERY: int = int(os.getenv("MAX_RESULTS_PER_QUERY", "10"))
 FRESHNESS: str = os.getenv("FRESHNESS", "pm")  # pm = past month
 
+# ── Brave API budget ──────────────────────────────────────────────────────────
+# Every call is logged to USAGE_LEDGER_FILE; runs are capped so these limits
+# are never exceeded (0 = no limit). Cost is only used for reporting.
+BRAVE_DAILY_LIMIT: int = int(os.getenv("BRAVE_DAILY_LIMIT", "0"))
+BRAVE_MONTHLY_LIMIT: int = int(os.getenv("BRAVE_MONTHLY_LIMIT", "2000"))
+BRAVE_COST_PER_1K: float = float(os.getenv("BRAVE_COST_PER_1K", "3.0"))  # USD per 1,000 calls
+
 # ── Search queries ────────────────────────────────────────────────────────────
 # Designed to surface senior AI/ML roles with real budget, EU/remote friendly
 SEARCH_QUERIES = [
@@ -44,50 +53,40 @@ SEARCH_QUERIES = [
     '"backend engineer" "LLM" OR "RAG" OR "AI" senior remote Europe contract OR permanent',
 ]
 
-# ── Relevance scoring weights ─────────────────────────────────────────────────
-# ── Hard filters (score override → 0) ────────────────────────────────────────
-# Any result matching these phrases fails the remote filter regardless of score
-REMOTE_REJECT_PHRASES = [
-    # Country/city requirements
-    "poland-based", "poland based", "must be in poland", "must be based in poland",
-    "krakow", "kraków", "warsaw office", "warsaw-based",
-    "germany-based", "uk-based", "netherlands-based", "france-based",
-    "must be located", "must reside", "must live in",
-    "requires relocation",
-    # On-site / hybrid signals
-    "on-site", "onsite", "on site",
-    "hybrid", "in-office", "in office",
-    "days in office", "days in-office", "days per week in",
-    "occasional travel required", "travel to office",
-    # LatAm-focused (not Spain/EU remote)
-    "latin america", "latam", "colombia", "costa rica",
-    "mexico city", "bogota", "são paulo",
-]
-
-SCORE_WEIGHTS = {
-    # Seniority signals (required)
-    "senior": 10, "principal": 15, "staff": 12, "lead": 10, "head of": 15,
-
-    # AI/ML role signals
-    "machine learning": 15, "ml engineer": 20, "ai engineer": 15,
-    "llm": 12, "rag": 12, "generative ai": 12, "nlp": 10,
-    "mlops": 12, "ml platform": 15, "model serving": 10,
+# ── Relevance scoring ─────────────────────────────────────────────────────────
+# Keyword weights and remote-reject phrases live in scoring_rules.json, which
+# is reloaded when it changes. Point SCORING_RULES_FILE elsewhere to experiment.
+SCORING_RULES_FILE = Path(
+    os.getenv("SCORING_RULES_FILE", str(Path(__file__).parent / "scoring_rules.json"))
+)
 
-    # Salary signals
-    "150k": 20, "€150": 20, "120k": 15, "€120": 15,
-    "100k": 10, "€100": 10, "$150": 20, "$120": 15,
+# Bonus per extra query that surfaced the same URL (a posting hit by several
+# independent queries is more likely a strong match), capped.
+QUERY_HIT_BONUS: int = 5
+QUERY_HIT_BONUS_CAP: int = 15
 
-    # Location/type signals
-    "remote": 8, "eu": 5, "europe": 5, "contract": 5,
-
-    # Java/backend crossover (Jurek's edge)
-    "java": 8, "spring": 5, "aws": 5, "backend": 5, "api": 3,
-
-    # Negative signals
-    "intern": -30, "junior": -30, "entry level": -25, "data scientist": -5,
-    "research": -5,  # pure research ≠ engineering
-}
+# ── Page enrichment ───────────────────────────────────────────────────────────
+# Optional stage (--enrich): fetch full posting pages for the top candidates
+# and rescore on the real text instead of the search snippet.
+ENRICH_TOP_N: int = int(os.getenv("ENRICH_TOP_N", "30"))  # max pages fetched per run
+ENRICH_CONCURRENCY: int = 8      # total in-flight page fetches
+ENRICH_PER_HOST: int = 2         # in-flight fetches per hostname
+ENRICH_TIMEOUT: float = 15.0     # seconds per page
+ENRICH_MAX_CHARS: int = 20000    # extracted text kept per page
+ENRICH_USER_AGENT = "job-search-tracker/0.1 (+https://github.com/kevin-bot-openclaw-ops/job-search-tracker)"
 
 # ── State ─────────────────────────────────────────────────────────────────────
 DATA_DIR = Path("data")
 SEEN_URLS_FILE = DATA_DIR / "seen_urls.json"
+PARSE_MEMO_FILE = DATA_DIR / "parse_memo.json"
+PARSE_MEMO_TTL_DAYS: int = 60  # drop memo entries not seen in this many days
+PAGE_CACHE_FILE = DATA_DIR / "page_cache.json"
+PAGE_CACHE_TTL_DAYS: int = 14  # drop cached pages not fetched/revalidated in this many days
+LAST_SEARCH_FILE = DATA_DIR / "last_search.json"  # raw results for replay / offline dry runs
+JOB_HISTORY_FILE = DATA_DIR / "job_history.jsonl"  # append-only log of every job recorded
+USAGE_LEDGER_FILE = DATA_DIR / "brave_usage.jsonl"  # every Brave API call + per-run yield
+
+# ── Export ────────────────────────────────────────────────────────────────────
+EXPORT_DIR = DATA_DIR / "exports"
+EXPORT_CHUNK_ROWS: int = 10_000       # rows per Parquet row group / columnar JSON chunk
+EXPORT_PART_ROWS: int = 500_000       # rows per part file before rolling to the next
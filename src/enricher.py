@@ -0,0 +1,293 @@
+"""Page enricher — fetches full job postings and rescores them on the real text.
+
+Brave only returns a short snippet, so remote-reject phrases and salary
+ranges buried in the posting are missed. This optional stage runs after
+deduplication on the top candidates:
+
+    urls ─→ bounded async pool (global + per-host limits)
+         ─→ conditional GET (ETag / Last-Modified, JSON cache on disk)
+         ─→ streaming HTML → text extraction (capped)
+         ─→ Ruleset.score_page() / extract_salary() on the full text
+
+Full text is scored by whole word, and remote-reject phrases are only
+checked against the page's ``<main>``/``<article>`` content, so a "Hybrid
+roles" menu link or a "hybrid cloud" sidebar can't drop a posting that
+dedup has already marked as seen.
+
+Enrichment only sees URLs that just passed deduplication, so in the normal
+pipeline each posting is fetched once. The conditional-GET cache pays off
+only when the same URL is enriched again within PAGE_CACHE_TTL_DAYS: an
+``enrich_jobs()`` call on already-recorded jobs, or a run after
+``seen_urls.json`` was reset. Entries past the TTL are pruned on save, so
+the cache stays small.
+"""
+
+import asyncio
+import codecs
+import json
+import logging
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .config import (
+    PAGE_CACHE_FILE, PAGE_CACHE_TTL_DAYS, ENRICH_CONCURRENCY, ENRICH_PER_HOST, ENRICH_TIMEOUT,
+    ENRICH_MAX_CHARS, ENRICH_USER_AGENT,
+)
+from .memo import query_hit_bonus
+from .parser import extract_salary, extract_location
+from .rules import current_ruleset
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 16 * 1024
+MAX_PAGE_BYTES = 2 * 1024 * 1024  # stop reading oversized pages
+
+
+class _TextExtractor(HTMLParser):
+    """Incremental HTML → text. Prefers <main>/<article> content when present."""
+
+    SKIP_TAGS = {"script", "style", "noscript", "svg", "template",
+                 "nav", "header", "footer", "form", "iframe"}
+    MAIN_TAGS = {"main", "article"}
+    BLOCK_TAGS = {"p", "div", "li", "br", "h1", "h2", "h3", "h4", "tr", "section"}
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self._skip_depth = 0
+        self._main_depth = 0
+        self._all: List[str] = []
+        self._main: List[str] = []
+        self._all_len = 0
+        self._main_len = 0
+
+    @property
+    def full(self) -> bool:
+        """Both buffers are capped, or the fallback is and we're outside <main>."""
+        return self._all_len >= self.max_chars and (
+            self._main_len >= self.max_chars or not self._main_depth)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.MAIN_TAGS:
+            self._main_depth += 1
+        if tag in self.BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in self.BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.MAIN_TAGS and self._main_depth:
+            self._main_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._append(data)
+
+    def _append(self, data: str):
+        if self._all_len < self.max_chars:
+            self._all.append(data)
+            self._all_len += len(data)
+        if self._main_depth and self._main_len < self.max_chars:
+            self._main.append(data)
+            self._main_len += len(data)
+
+    def _render(self, parts: List[str]) -> str:
+        lines = (" ".join(line.split()) for line in "".join(parts).splitlines())
+        return "\n".join(line for line in lines if line)[:self.max_chars]
+
+    def text(self) -> str:
+        return self._render(self._main if self._main_len > 200 else self._all)
+
+    def main_text(self) -> str:
+        return self._render(self._main)
+
+
+def extract_page(chunks, charset: str = "utf-8",
+                 max_chars: int = ENRICH_MAX_CHARS) -> Tuple[str, str]:
+    """
+    Extract readable text from an iterable of HTML byte chunks.
+
+    Returns (page text, <main>/<article> text or "" if the page has none).
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parser = _TextExtractor(max_chars)
+    read = 0
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+        read += len(chunk)
+        if parser.full or read >= MAX_PAGE_BYTES:
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.text(), parser.main_text()
+
+
+def _cached_page(cached: Optional[Dict]) -> Optional[Tuple[str, str]]:
+    return (cached.get("text", ""), cached.get("main", "")) if cached else None
+
+
+class PageFetcher:
+    """Fetches posting pages concurrently with a conditional-GET disk cache."""
+
+    def __init__(self, cache_file: Path = PAGE_CACHE_FILE,
+                 concurrency: int = ENRICH_CONCURRENCY,
+                 per_host: int = ENRICH_PER_HOST,
+                 timeout: float = ENRICH_TIMEOUT):
+        self.cache_file = cache_file
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self._cache: Dict[str, Dict] = self._load()
+        self.not_modified = 0
+        self.fetched = 0
+
+    def _load(self) -> Dict[str, Dict]:
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file) as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, Exception) as e:
+                logger.warning(f"Could not load page cache: {e}. Starting fresh.")
+        return {}
+
+    def _save(self):
+        cutoff = (datetime.now(timezone.utc)
+                  - timedelta(days=PAGE_CACHE_TTL_DAYS)).strftime("%Y-%m-%d")
+        self._cache = {
+            url: entry for url, entry in self._cache.items()
+            if entry.get("fetched", "") >= cutoff
+        }
+        with open(self.cache_file, "w") as f:
+            json.dump(self._cache, f, indent=2, sort_keys=True)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def fetch_all(self, urls: List[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Fetch and extract text for each URL.
+
+        Returns {url: (text, main_text)}; URLs that failed and have no cached
+        copy are omitted.
+        """
+        if not urls:
+            return {}
+        texts = asyncio.run(self._fetch_all(list(dict.fromkeys(urls))))
+        self._save()
+        logger.info(
+            f"Enrichment fetch: {len(texts)}/{len(urls)} pages "
+            f"({self.fetched} fetched, {self.not_modified} not modified)"
+        )
+        return texts
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    async def _fetch_all(self, urls: List[str]) -> Dict[str, Tuple[str, str]]:
+        pool = asyncio.Semaphore(self.concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def worker(url: str):
+            host = (urlsplit(url).hostname or "").lower()
+            host_sem = host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+            async with host_sem, pool:
+                return url, await asyncio.to_thread(self._get, url, self._cache.get(url))
+
+        pages = {}
+        for url, (page, entry, not_modified) in await asyncio.gather(
+                *(worker(u) for u in urls)):
+            if entry is not None:
+                self._cache[url] = entry
+                self.fetched += not not_modified
+            self.not_modified += not_modified
+            if page is not None:
+                pages[url] = page
+        return pages
+
+    def _get(self, url: str,
+             cached: Optional[Dict]) -> Tuple[Optional[Tuple[str, str]], Optional[Dict], bool]:
+        """
+        Blocking conditional GET; runs in a worker thread.
+
+        Returns ((text, main_text) or None, new cache entry or None, whether
+        the server sent 304).
+        A 304 returns the cached entry with a refreshed ``fetched`` date.
+        """
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        headers = {"User-Agent": ENRICH_USER_AGENT, "Accept": "text/html"}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                if resp.headers.get_content_type() not in ("text/html", "application/xhtml+xml"):
+                    logger.debug(f"Skipping non-HTML page: {url[:80]}")
+                    return None, None, False
+                charset = resp.headers.get_content_charset() or "utf-8"
+                text, main = extract_page(iter(lambda: resp.read(READ_CHUNK), b""), charset)
+                etag = resp.headers.get("ETag", "")
+                last_modified = resp.headers.get("Last-Modified", "")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                return _cached_page(cached), {**cached, "fetched": today}, True
+            logger.warning(f"HTTP {e.code} fetching {url[:80]}")
+            return _cached_page(cached), None, False
+        except Exception as e:
+            logger.warning(f"Fetch failed for {url[:80]}: {e}")
+            return _cached_page(cached), None, False
+
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "text": text,
+            "main": main,
+            "fetched": today,
+        }
+        return (text, main), entry, False
+
+
+def enrich_jobs(jobs: List[Dict], fetcher: PageFetcher = None) -> List[Dict]:
+    """
+    Rescore jobs against their full posting text.
+
+    Jobs whose page could not be fetched keep their snippet-based score.
+    A remote-reject phrase in the posting body drops the score to 0.
+    """
+    fetcher = fetcher or PageFetcher()
+    pages = fetcher.fetch_all([job["url"] for job in jobs])
+    ruleset = current_ruleset()
+
+    for job in jobs:
+        text, main = pages.get(job["url"], ("", ""))
+        if not text:
+            continue
+        score = ruleset.score_page(f"{job['title']} {text}".lower(), main.lower())
+        if score > 0:
+            score += query_hit_bonus(job.get("query_hits", 1))
+        job["score"] = score
+        if not job.get("salary"):
+            job["salary"] = extract_salary(text)
+        if job.get("location", "Unknown") == "Unknown":
+            job["location"] = extract_location(text)
+        job["ruleset"] = ruleset.digest
+        job["enriched"] = True
+
+    return jobs
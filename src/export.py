@@ -0,0 +1,254 @@
+"""History export — streams the job history into compressed, columnar part files.
+
+    data/job_history.jsonl ─→ chunks of EXPORT_CHUNK_ROWS rows (column-major)
+                           ─→ jobs-part-00000.parquet        (pyarrow installed, zstd)
+                              jobs-part-00000.jsonl.zst|.gz  (fallback)
+
+In the JSONL fallback each line is one chunk in column form,
+``{"score": [...], "title": [...], ...}``, so ``pandas.DataFrame(json.loads(line))``
+rebuilds it directly. Only one chunk is held in memory at a time. A part
+file rolls over after EXPORT_PART_ROWS rows and is written under a temporary
+name until complete.
+
+A watermark (byte offset into the history log, plus the format and
+compression of the parts) is saved next to the parts after each one is
+finalised; ``incremental=True`` resumes from it and only appends new part
+files. If the format or compression has changed since — e.g. pyarrow was
+installed — it does a full export instead of mixing file types.
+"""
+
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import EXPORT_DIR, EXPORT_CHUNK_ROWS, EXPORT_PART_ROWS
+from .history import JobHistory
+
+logger = logging.getLogger(__name__)
+
+# Column order and logical type of every exported column
+EXPORT_SCHEMA = [
+    ("recorded_at", "string"), ("date_found", "string"), ("score", "int"),
+    ("title", "string"), ("company", "string"), ("location", "string"),
+    ("salary", "string"), ("source", "string"), ("status", "string"),
+    ("url", "string"), ("description", "string"), ("ruleset", "string"),
+    ("query_hits", "int"), ("enriched", "bool"),
+]
+
+PART_PREFIX = "jobs-part-"
+WATERMARK_NAME = "_watermark.json"
+
+
+def _coerce(value, kind: str):
+    if value is None or value == "":
+        return False if kind == "bool" else (None if kind == "int" else "")
+    if kind == "int":
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    if kind == "bool":
+        return bool(value)
+    return str(value)
+
+
+def resolve_format(fmt: str = "auto") -> str:
+    """Pick 'parquet' when pyarrow is importable, else 'jsonl'."""
+    if fmt not in ("auto", "parquet", "jsonl"):
+        raise ValueError(f"Unknown export format: {fmt}")
+    if fmt == "jsonl":
+        return fmt
+    try:
+        import pyarrow.parquet  # noqa: F401
+        return "parquet"
+    except ImportError:
+        if fmt == "parquet":
+            raise ValueError("Parquet export needs pyarrow — pip install pyarrow")
+        return "jsonl"
+
+
+def _jsonl_compression() -> str:
+    try:
+        import zstandard  # noqa: F401
+        return "zstd"
+    except ImportError:
+        return "gzip"
+
+
+# ── Part writers ──────────────────────────────────────────────────────────────
+
+class _ParquetPart:
+    """One Parquet file; each chunk becomes a row group."""
+
+    suffix = ".parquet"
+
+    def __init__(self, path: Path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {"string": pa.string(), "int": pa.int64(), "bool": pa.bool_()}
+        self._pa = pa
+        self._schema = pa.schema([(name, types[kind]) for name, kind in EXPORT_SCHEMA])
+        self.path = path
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._writer = pq.ParquetWriter(str(self._tmp), self._schema, compression="zstd")
+
+    def write_chunk(self, columns: Dict[str, List]):
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+        os.replace(self._tmp, self.path)
+
+
+class _ColumnarJsonlPart:
+    """One compressed JSONL file; each line is a chunk in column form."""
+
+    def __init__(self, path: Path, compression: str):
+        self.path = path
+        self._tmp = path.with_name(path.name + ".tmp")
+        if compression == "zstd":
+            import zstandard
+            self._f = zstandard.ZstdCompressor(level=10).stream_writer(open(self._tmp, "wb"))
+        else:
+            self._f = gzip.open(self._tmp, "wb")
+
+    def write_chunk(self, columns: Dict[str, List]):
+        self._f.write((json.dumps(columns, ensure_ascii=False) + "\n").encode("utf-8"))
+
+    def close(self):
+        self._f.close()
+        os.replace(self._tmp, self.path)
+
+
+# ── Exporter ──────────────────────────────────────────────────────────────────
+
+class HistoryExporter:
+    """Exports JobHistory to chunked columnar files, optionally incrementally."""
+
+    def __init__(self, history: JobHistory = None, out_dir: Path = EXPORT_DIR,
+                 fmt: str = "auto", chunk_rows: int = EXPORT_CHUNK_ROWS,
+                 part_rows: int = EXPORT_PART_ROWS, compression: str = "auto"):
+        self.history = history or JobHistory()
+        self.out_dir = Path(out_dir)
+        self.format = resolve_format(fmt)
+        if self.format == "parquet":
+            self.compression = "zstd"
+        else:
+            self.compression = _jsonl_compression() if compression == "auto" else compression
+        self.chunk_rows = chunk_rows
+        self.part_rows = part_rows
+        self.watermark_file = self.out_dir / WATERMARK_NAME
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def export(self, incremental: bool = False) -> Dict:
+        """
+        Export history rows to part files.
+
+        Returns a summary dict: format, rows, files, offset.
+        """
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        watermark = self._load_watermark() if incremental else None
+        if watermark and watermark["offset"] > self.history.size():
+            logger.warning("Job history is shorter than the export watermark — "
+                           "re-exporting from the start")
+            watermark = None
+        layout = {"format": self.format, "compression": self.compression}
+        if watermark and {key: watermark.get(key) for key in layout} != layout:
+            logger.warning(f"Export layout changed ({watermark.get('format')}/"
+                           f"{watermark.get('compression')} → {self.format}/"
+                           f"{self.compression}) — re-exporting from the start")
+            watermark = None
+        if watermark is None:
+            self._clear_parts()
+            watermark = {"offset": 0, "rows": 0, "next_part": 0, **layout}
+
+        base_rows = watermark["rows"]
+        files: List[str] = []
+        columns = self._empty_columns()
+        buffered = 0
+        part = None
+        part_count = 0
+        offset = watermark["offset"]
+        exported = 0
+
+        for offset, row in self.history.iter_from(watermark["offset"]):
+            for name, kind in EXPORT_SCHEMA:
+                columns[name].append(_coerce(row.get(name), kind))
+            buffered += 1
+            exported += 1
+            if buffered >= self.chunk_rows:
+                part, part_count = self._flush(part, part_count, columns, watermark, files)
+                columns, buffered = self._empty_columns(), 0
+                if part is None:
+                    self._save_watermark(watermark, offset, base_rows + exported)
+
+        if buffered:
+            part, part_count = self._flush(part, part_count, columns, watermark, files)
+        if part is not None:
+            part.close()
+        if exported:
+            self._save_watermark(watermark, offset, base_rows + exported)
+
+        logger.info(f"Exported {exported} rows to {len(files)} {self.format} file(s) "
+                    f"in {self.out_dir}")
+        return {"format": self.format, "rows": exported, "files": files,
+                "offset": watermark["offset"]}
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _empty_columns() -> Dict[str, List]:
+        return {name: [] for name, _ in EXPORT_SCHEMA}
+
+    def _open_part(self, index: int):
+        stem = self.out_dir / f"{PART_PREFIX}{index:05d}"
+        if self.format == "parquet":
+            return _ParquetPart(stem.with_name(stem.name + _ParquetPart.suffix))
+        ext = ".jsonl.zst" if self.compression == "zstd" else ".jsonl.gz"
+        return _ColumnarJsonlPart(stem.with_name(stem.name + ext), self.compression)
+
+    def _flush(self, part, part_count: int, columns: Dict[str, List],
+               watermark: Dict, files: List[str]):
+        """Write one chunk; close the part once it reaches part_rows."""
+        if part is None:
+            part = self._open_part(watermark["next_part"])
+            watermark["next_part"] += 1
+            files.append(part.path.name)
+            part_count = 0
+        part.write_chunk(columns)
+        part_count += len(columns["url"])
+        if part_count >= self.part_rows:
+            part.close()
+            part = None
+        return part, part_count
+
+    def _clear_parts(self):
+        for path in self.out_dir.glob(f"{PART_PREFIX}*"):
+            path.unlink()
+        if self.watermark_file.exists():
+            self.watermark_file.unlink()
+
+    def _load_watermark(self) -> Optional[Dict]:
+        if not self.watermark_file.exists():
+            return None
+        try:
+            with open(self.watermark_file) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, Exception) as e:
+            logger.warning(f"Could not load export watermark: {e}. Doing a full export.")
+            return None
+
+    def _save_watermark(self, watermark: Dict, offset: int, rows: int):
+        watermark["offset"] = offset
+        watermark["rows"] = rows
+        watermark["exported_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        tmp = self.watermark_file.with_name(WATERMARK_NAME + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(watermark, f, indent=2)
+        os.replace(tmp, self.watermark_file)
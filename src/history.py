@@ -0,0 +1,61 @@
+"""Job history — append-only JSONL log of every job the pipeline recorded.
+
+One JSON object per line, written once per run after ranking. Unlike the
+Google Sheet this is local, complete and cheap to stream, so analytics
+(see ``export.py``) read from here.
+"""
+
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from .config import JOB_HISTORY_FILE
+
+logger = logging.getLogger(__name__)
+
+
+class JobHistory:
+    """Appends jobs to, and streams them back from, the history log."""
+
+    def __init__(self, history_file: Path = JOB_HISTORY_FILE):
+        self.history_file = history_file
+
+    def append(self, jobs: List[Dict]) -> int:
+        """Append jobs with a ``recorded_at`` timestamp. Returns rows written."""
+        if not jobs:
+            return 0
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with open(self.history_file, "a", encoding="utf-8") as f:
+            for job in jobs:
+                f.write(json.dumps({**job, "recorded_at": recorded_at},
+                                   ensure_ascii=False) + "\n")
+        logger.info(f"Recorded {len(jobs)} jobs in {self.history_file}")
+        return len(jobs)
+
+    def iter_from(self, offset: int = 0) -> Iterator[Tuple[int, Dict]]:
+        """
+        Stream jobs starting at byte ``offset``.
+
+        Yields (offset after the row, row). A trailing partial line (a run
+        still writing) is not yielded, so the offset is always a safe
+        resume point.
+        """
+        if not self.history_file.exists():
+            return
+        with open(self.history_file, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                if line.strip():
+                    try:
+                        yield offset, json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping corrupt history line ending at byte {offset}")
+
+    def size(self) -> int:
+        return self.history_file.stat().st_size if self.history_file.exists() else 0
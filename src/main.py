@@ -4,20 +4,33 @@ Usage:
     python -m src.main                    # run all queries, push to sheet
     python -m src.main --dry-run          # print results, skip sheet write
     python -m src.main --sheet-id=<id>   # use existing sheet
+    python -m src.main --enrich           # rescore top candidates on full page text
+    python -m src.main replay             # rescore the last search offline
+    python -m src.main queries            # list configured search queries
+    python -m src.main export [--incremental] [--format=parquet|jsonl]
+                                          # export job history for analytics
+    python -m src.main usage [--since=2026-10]
+                                          # Brave API calls, budget, cost per new job
+
+Pipeline modules (and their third-party dependencies) are imported inside
+the command that needs them, so offline commands start fast and never need
+network credentials.
 """
 
 import argparse
 import json
 import logging
-import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict
 
-from .config import SEARCH_QUERIES, SHEET_ID, DATA_DIR
-from .searcher import BraveSearcher
-from .parser import parse_results
-from .deduplicator import Deduplicator
-from .sheets import SheetsWriter
+from .config import (
+    SEARCH_QUERIES, SHEET_ID, DATA_DIR, ENRICH_TOP_N, BRAVE_API_KEY, LAST_SEARCH_FILE,
+    EXPORT_DIR,
+)
+
+if TYPE_CHECKING:
+    from .sheets import SheetsWriter
 
 logging.basicConfig(
     level=logging.INFO,
@@ -28,7 +41,7 @@ logger = logging.getLogger(__name__)
 SHEET_ID_FILE = DATA_DIR / "sheet_id.txt"
 
 
-def load_or_create_sheet_id(writer: SheetsWriter) -> str:
+def load_or_create_sheet_id(writer: "SheetsWriter") -> str:
     """Load persisted sheet ID or create a new sheet."""
     # Priority: CLI arg > env var > saved file > create new
     if writer.sheet_id:
@@ -53,26 +66,58 @@ def load_or_create_sheet_id(writer: SheetsWriter) -> str:
     return sheet_id
 
 
-def run(dry_run: bool = False, sheet_id: str = "", top_n: int = 50):
+def run(dry_run: bool = False, sheet_id: str = "", top_n: int = 50,
+        enrich: bool = False):
     """Execute the full job search pipeline."""
+    from .memo import ResultMemo
+    from .deduplicator import Deduplicator
+    from .history import JobHistory
 
     logger.info("=== Job Search Tracker ===")
 
+    # A dry run without credentials is an offline replay of the last search:
+    # its URLs are already in seen_urls.json, so dedup would drop them all.
+    if dry_run and not BRAVE_API_KEY:
+        logger.warning("BRAVE_API_KEY not set — replaying last cached search")
+        return replay(top_n=top_n)
+
     # 1. Search
-    logger.info(f"Running {len(SEARCH_QUERIES)} search queries via Brave API...")
-    searcher = BraveSearcher()
-    raw = searcher.search_all(SEARCH_QUERIES)
+    from .searcher import BraveSearcher
+    from .usage import UsageLedger
+
+    # Budget check: never exceed the configured daily/monthly call limits
+    ledger = UsageLedger()
+    queries = ledger.cap_queries(SEARCH_QUERIES)
+    if not queries:
+        logger.error("Brave API budget exhausted — skipping search")
+        return None
+
+    logger.info(f"Running {len(queries)} search queries via Brave API...")
+    searcher = BraveSearcher(ledger=ledger)
+    raw = searcher.search_all(queries)
+    _save_last_search(raw)
     logger.info(f"Raw results: {len(raw)}")
 
-    # 2. Parse + score
-    jobs = parse_results(raw)
+    # 2. Parse + score (each unique result once, memoized across runs)
+    jobs = ResultMemo().parse(raw)
 
     # 3. Deduplicate across runs
     dedup = Deduplicator()
     new_jobs = dedup.filter_new(jobs)
+    ledger.record_yield(raw, {j["url"] for j in new_jobs})
 
     # 4. Sort by relevance score, take top N
     new_jobs.sort(key=lambda j: j["score"], reverse=True)
+
+    # 4b. Optional: rescore the top candidates on their full posting text
+    if enrich:
+        from .enricher import enrich_jobs
+
+        # Fetch at most ENRICH_TOP_N pages; the rest keep their snippet scores
+        enriched = enrich_jobs(new_jobs[:ENRICH_TOP_N])
+        new_jobs = [j for j in enriched if j["score"] >= 5] + new_jobs[ENRICH_TOP_N:]
+        new_jobs.sort(key=lambda j: j["score"], reverse=True)
+
     new_jobs = new_jobs[:top_n]
 
     logger.info(f"New jobs after deduplication: {len(new_jobs)}")
@@ -81,10 +126,15 @@ def run(dry_run: bool = False, sheet_id: str = "", top_n: int = 50):
     _print_summary(new_jobs)
 
     if dry_run:
-        logger.info("DRY RUN — skipping Google Sheets write")
+        logger.info("DRY RUN — skipping Google Sheets write and job history")
         return new_jobs
 
-    # 6. Push to Google Sheets
+    # 6. Record in the local analytics history (real runs only)
+    JobHistory().append(new_jobs)
+
+    # 7. Push to Google Sheets
+    from .sheets import SheetsWriter
+
     writer = SheetsWriter(sheet_id=sheet_id)
     sid = load_or_create_sheet_id(writer)
     written = writer.append_jobs(new_jobs)
@@ -94,6 +144,68 @@ def run(dry_run: bool = False, sheet_id: str = "", top_n: int = 50):
     return new_jobs
 
 
+def replay(top_n: int = 50):
+    """
+    Re-parse and rescore the last cached search without touching the network,
+    the seen-URL state or the sheet. Useful after tuning scoring rules.
+    """
+    from .memo import ResultMemo
+
+    raw = _load_last_search()
+    if raw is None:
+        return None
+    jobs = ResultMemo().parse(raw)
+    jobs.sort(key=lambda j: j["score"], reverse=True)
+    jobs = jobs[:top_n]
+    _print_summary(jobs)
+    return jobs
+
+
+def list_queries():
+    """Print the configured search queries."""
+    for i, query in enumerate(SEARCH_QUERIES, 1):
+        print(f"{i:>3}  {query}")
+    return SEARCH_QUERIES
+
+
+def usage_report(since: str = ""):
+    """Print Brave API usage, budget and cost per new job by query and board."""
+    from .usage import UsageLedger, format_report
+
+    report = UsageLedger().report(since=since)
+    print(format_report(report))
+    return report
+
+
+def export_history(incremental: bool = False, fmt: str = "auto", out_dir: str = ""):
+    """Export the local job history as compressed columnar part files."""
+    from .export import HistoryExporter
+
+    try:
+        exporter = HistoryExporter(out_dir=Path(out_dir) if out_dir else EXPORT_DIR, fmt=fmt)
+    except ValueError as e:
+        logger.error(str(e))
+        return None
+    result = exporter.export(incremental=incremental)
+    print(f"Exported {result['rows']} rows as {result['format']} "
+          f"to {exporter.out_dir} ({len(result['files'])} new file(s))")
+    return result
+
+
+def _save_last_search(raw: List[Dict]):
+    DATA_DIR.mkdir(exist_ok=True)
+    with open(LAST_SEARCH_FILE, "w") as f:
+        json.dump(raw, f, indent=2)
+
+
+def _load_last_search():
+    if not LAST_SEARCH_FILE.exists():
+        logger.error(f"No cached search at {LAST_SEARCH_FILE} — run a search first")
+        return None
+    with open(LAST_SEARCH_FILE) as f:
+        return json.load(f)
+
+
 def _print_summary(jobs):
     """Print ranked job list to stdout."""
     if not jobs:
@@ -117,19 +229,47 @@ def _print_summary(jobs):
 
 def main():
     parser = argparse.ArgumentParser(description="Job Search Tracker")
+    parser.add_argument("command", nargs="?", default="run",
+                        choices=["run", "replay", "queries", "export", "usage"],
+                        help="run (default): search and push; replay: rescore the "
+                             "last search offline; queries: list search queries; "
+                             "export: write job history for analytics; "
+                             "usage: Brave API usage and cost report")
     parser.add_argument("--dry-run", action="store_true",
                         help="Print results without writing to Google Sheets")
     parser.add_argument("--sheet-id", default="",
                         help="Existing Google Sheet ID to append to")
     parser.add_argument("--top", type=int, default=50,
                         help="Maximum jobs to write per run (default: 50)")
+    parser.add_argument("--enrich", action="store_true",
+                        help="Fetch full posting pages for top candidates and rescore")
+    parser.add_argument("--incremental", action="store_true",
+                        help="export: only append rows since the last export")
+    parser.add_argument("--format", default="auto", choices=["auto", "parquet", "jsonl"],
+                        help="export: file format (default: parquet if pyarrow is installed)")
+    parser.add_argument("--out", default="",
+                        help="export: output directory (default: data/exports)")
+    parser.add_argument("--since", default="",
+                        help="usage: only include calls from this ISO date prefix on "
+                             "(e.g. 2026-10)")
     args = parser.parse_args()
 
-    jobs = run(
-        dry_run=args.dry_run,
-        sheet_id=args.sheet_id,
-        top_n=args.top,
-    )
+    if args.command == "queries":
+        jobs = list_queries()
+    elif args.command == "usage":
+        jobs = usage_report(since=args.since)
+    elif args.command == "export":
+        jobs = export_history(incremental=args.incremental, fmt=args.format,
+                              out_dir=args.out)
+    elif args.command == "replay":
+        jobs = replay(top_n=args.top)
+    else:
+        jobs = run(
+            dry_run=args.dry_run,
+            sheet_id=args.sheet_id,
+            top_n=args.top,
+            enrich=args.enrich,
+        )
 
     return 0 if jobs is not None else 1
 
@@ -0,0 +1,144 @@
+"""Result memo — parses each unique search result once, within and across runs.
+
+Sits between ``BraveSearcher.search_all`` and the deduplicator. Overlapping
+queries return the same posting many times; results are keyed by a hash of
+(url, title, description) so each distinct result is parsed and scored once,
+and the parsed job (or the fact that it was rejected) is persisted in a JSON
+state file for later runs. Entries remember the scoring ruleset digest and
+a fingerprint of the parser/classifier source, and are re-parsed when the
+content, the ruleset or the parsing code changed. The number of
+distinct queries that surfaced a URL is kept on the job as ``query_hits``
+and turned into a small score bonus.
+"""
+
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import (
+    PARSE_MEMO_FILE, PARSE_MEMO_TTL_DAYS, QUERY_HIT_BONUS, QUERY_HIT_BONUS_CAP,
+)
+from . import classifier, parser
+from .parser import parse_result
+from .rules import Ruleset, current_ruleset
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(raw: Dict) -> str:
+    """Stable hash of the fields that determine how a result is parsed."""
+    key = "\0".join(
+        raw.get(field, "").strip() for field in ("url", "title", "description")
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:20]
+
+
+def parser_fingerprint() -> str:
+    """
+    Hash of the parser and classifier source files.
+
+    Any edit to HOST_RULES, NON_JOB_TITLE_PATTERNS, salary/location
+    extraction etc. changes it, invalidating memoized parse results.
+    """
+    digest = hashlib.sha256()
+    for module in (parser, classifier):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def query_hit_bonus(hits: int) -> int:
+    """Score bonus for a URL surfaced by ``hits`` distinct queries."""
+    return min(max(hits - 1, 0) * QUERY_HIT_BONUS, QUERY_HIT_BONUS_CAP)
+
+
+class ResultMemo:
+    """Memoizes parse_result() output per result content hash."""
+
+    def __init__(self, state_file: Path = PARSE_MEMO_FILE):
+        self.state_file = state_file
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self._entries: Dict[str, Dict] = self._load()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.rescored = 0  # misses caused by a ruleset or parser change
+        self.parser_version = parser_fingerprint()
+
+    def _load(self) -> Dict[str, Dict]:
+        if self.state_file.exists():
+            try:
+                with open(self.state_file) as f:
+                    data = json.load(f)
+                logger.info(f"Loaded {len(data)} memoized parse results")
+                return data
+            except (json.JSONDecodeError, Exception) as e:
+                logger.warning(f"Could not load parse memo: {e}. Starting fresh.")
+        return {}
+
+    def _save(self):
+        cutoff = (datetime.now(timezone.utc)
+                  - timedelta(days=PARSE_MEMO_TTL_DAYS)).strftime("%Y-%m-%d")
+        self._entries = {
+            h: entry for h, entry in self._entries.items()
+            if entry.get("last_seen", "") >= cutoff
+        }
+        with open(self.state_file, "w") as f:
+            json.dump(self._entries, f, indent=2, sort_keys=True)
+
+    def _parse_one(self, key: str, raw: Dict, ruleset: Ruleset,
+                   today: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if (entry is not None and entry.get("ruleset") == ruleset.digest
+                and entry.get("parser") == self.parser_version):
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            self.rescored += entry is not None
+            entry = {"job": parse_result(raw, ruleset), "ruleset": ruleset.digest,
+                     "parser": self.parser_version}
+            self._entries[key] = entry
+        entry["last_seen"] = today
+
+        if entry["job"] is None:
+            return None
+        job = dict(entry["job"])
+        job["date_found"] = today
+        return job
+
+    def parse(self, raw_results: List[Dict]) -> List[Dict]:
+        """
+        Parse raw results, computing each unique result at most once.
+
+        Returns one job per unique (url, title, description), with
+        ``query_hits`` set and the query-overlap bonus added to ``score``.
+        """
+        queries_by_url = defaultdict(set)
+        unique: Dict[str, Dict] = {}
+        for i, raw in enumerate(raw_results):
+            url = raw.get("url", "").strip()
+            queries_by_url[url].add(raw.get("query", i))
+            unique.setdefault(content_hash(raw), raw)
+
+        ruleset = current_ruleset()
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        jobs = []
+        for key, raw in unique.items():
+            job = self._parse_one(key, raw, ruleset, today)
+            if job is None:
+                continue
+            hits = len(queries_by_url[job["url"]])
+            job["query_hits"] = hits
+            job["score"] += query_hit_bonus(hits)
+            jobs.append(job)
+
+        self._save()
+        logger.info(
+            f"Parse memo: {len(raw_results)} raw → {len(unique)} unique "
+            f"({self.cache_hits} cached, {self.cache_misses} parsed, "
+            f"{self.rescored} re-parsed for ruleset {ruleset.digest} / "
+            f"parser {self.parser_version}) → {len(jobs)} relevant"
+        )
+        return jobs
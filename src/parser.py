@@ -2,34 +2,28 @@
 
 import re
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, timezone
 
-from .config import SCORE_WEIGHTS, REMOTE_REJECT_PHRASES
+from .classifier import classify_url
+from .rules import Ruleset, current_ruleset
 
 logger = logging.getLogger(__name__)
 
 
-def score_result(result: Dict) -> int:
+def score_result(result: Dict, ruleset: Ruleset = None) -> int:
     """
     Score a result by relevance to Jurek's target criteria.
 
     HARD FILTER: Returns 0 immediately if any remote-reject phrase is found
     (on-site, hybrid, country-specific location requirements).
     Jurek is based in Canary Islands, Spain — fully remote only.
+
+    Uses the current scoring rules file unless a ruleset is given.
     """
+    ruleset = ruleset or current_ruleset()
     text = f"{result.get('title', '')} {result.get('description', '')}".lower()
-
-    # Hard filter: reject non-remote roles immediately
-    for phrase in REMOTE_REJECT_PHRASES:
-        if phrase in text:
-            return 0
-
-    score = 0
-    for keyword, weight in SCORE_WEIGHTS.items():
-        if keyword.lower() in text:
-            score += weight
-    return score
+    return ruleset.score(text)
 
 
 def extract_salary(text: str) -> str:
@@ -65,59 +59,67 @@ def extract_location(text: str) -> str:
     return ", ".join(signals) if signals else "Unknown"
 
 
+def parse_result(raw: Dict, ruleset: Ruleset = None) -> Optional[Dict]:
+    """
+    Parse and score a single raw Brave Search result.
+
+    Returns a structured job dict tagged with the ruleset digest that
+    scored it, or None if the result is filtered out.
+    """
+    ruleset = ruleset or current_ruleset()
+    title = raw.get("title", "").strip()
+    url = raw.get("url", "").strip()
+    description = raw.get("description", "").strip()
+
+    if not url or not title:
+        return None
+
+    full_text = f"{title} {description}"
+    score = score_result(raw, ruleset)
+
+    # Skip very low scores — clearly not relevant
+    if score < 5:
+        logger.debug(f"Skipping low-score result (score={score}): {title[:50]}")
+        return None
+
+    # Skip salary guides / articles masquerading as jobs
+    info = classify_url(url, title)
+    if not info.is_job or _is_non_job_title(title):
+        logger.debug(f"Skipping non-job page: {title[:50]}")
+        return None
+
+    return {
+        "title": title,
+        "company": info.company,
+        "url": url,
+        "description": description[:300],  # truncate for sheet
+        "salary": extract_salary(full_text),
+        "location": extract_location(full_text),
+        "score": score,
+        "date_found": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+        "source": info.source,
+        "status": "new",
+        "ruleset": ruleset.digest,
+    }
+
+
 def parse_results(raw_results: List[Dict]) -> List[Dict]:
     """
     Parse and enrich raw Brave Search results.
 
     Returns list of structured job dicts.
     """
+    ruleset = current_ruleset()
     jobs = []
     for raw in raw_results:
-        title = raw.get("title", "").strip()
-        url = raw.get("url", "").strip()
-        description = raw.get("description", "").strip()
-
-        if not url or not title:
-            continue
-
-        full_text = f"{title} {description}"
-        score = score_result(raw)
-
-        # Skip very low scores — clearly not relevant
-        if score < 5:
-            logger.debug(f"Skipping low-score result (score={score}): {title[:50]}")
-            continue
-
-        # Skip salary guides / articles masquerading as jobs
-        if _is_non_job(url, title):
-            logger.debug(f"Skipping non-job page: {title[:50]}")
-            continue
-
-        jobs.append({
-            "title": title,
-            "url": url,
-            "description": description[:300],  # truncate for sheet
-            "salary": extract_salary(full_text),
-            "location": extract_location(full_text),
-            "score": score,
-            "date_found": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-            "source": _extract_source(url),
-            "status": "new",
-        })
+        job = parse_result(raw, ruleset)
+        if job is not None:
+            jobs.append(job)
 
     logger.info(f"Parsed {len(jobs)} relevant jobs from {len(raw_results)} raw results")
     return jobs
 
 
-NON_JOB_URL_PATTERNS = [
-    "salary", "calculator", "guide", "article", "blog", "news",
-    "reddit.com", "quora.com", "medium.com", "levels.fyi",
-    "glassdoor.com/salary", "indeed.com/career", "builtin.com/salary",
-    "ziprecruiter.com/salary", "payscale.com", "compensation",
-    "wikipedia.org",
-    "udemy.com", "coursera.org", "edx.org",  # courses, not jobs
-    "omnis.partners",  # aggregator with known hybrid/remote mismatch
-]
 NON_JOB_TITLE_PATTERNS = [
     "salary guide", "salary calculator", "complete guide", "how to",
     "what is", "breakdown by", "average salary", "salaries in",
@@ -130,37 +132,11 @@ NON_JOB_TITLE_PATTERNS = [
 ]
 
 
-def _is_non_job(url: str, title: str) -> bool:
-    """Return True if the result looks like a non-job page."""
-    url_lower = url.lower()
+def _is_non_job_title(title: str) -> bool:
+    """Return True if the title looks like an article rather than a posting."""
     title_lower = title.lower()
-
-    # remoteok.com category listing pages (not individual job postings)
-    if "remoteok.com" in url_lower and "/remote-jobs/" not in url_lower:
-        return True
-
-    for pattern in NON_JOB_URL_PATTERNS:
-        if pattern in url_lower:
-            return True
     for pattern in NON_JOB_TITLE_PATTERNS:
         if pattern in title_lower:
             return True
     return False
 
-
-def _extract_source(url: str) -> str:
-    """Identify job board from URL."""
-    url_lower = url.lower()
-    if "linkedin.com" in url_lower:
-        return "LinkedIn"
-    if "remoteok" in url_lower:
-        return "RemoteOK"
-    if "weworkremotely" in url_lower:
-        return "WeWorkRemotely"
-    if "indeed.com" in url_lower:
-        return "Indeed"
-    if "glassdoor" in url_lower:
-        return "Glassdoor"
-    if "ycombinator" in url_lower or "workatastartup" in url_lower:
-        return "YC Jobs"
-    return "Web"
@@ -0,0 +1,178 @@
+"""Scoring rules — compiles the external rules file into an immutable, hashed ruleset.
+
+Weights and remote-reject phrases live in ``scoring_rules.json`` (path
+overridable via ``SCORING_RULES_FILE``). Either section may be flat or
+grouped one level deep for readability:
+
+    {"score_weights": {"seniority": {"senior": 10, ...}, ...},
+     "remote_reject_phrases": {"onsite_hybrid": ["hybrid", ...], ...}}
+
+The compiled ruleset's ``digest`` identifies the rules that produced a
+score. It is stored on every job and keys the parse memo, so memoized
+results scored under older rules are re-parsed the next time they are seen.
+Stored jobs are not rescored. The file is re-read when its mtime or size
+changes — no restart needed.
+
+Search snippets are matched by substring. Full page text (``score_page``)
+is matched by whole word instead — over thousands of characters, "intern"
+would otherwise hit "international" and "rag" would hit "storage".
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Pattern, Tuple
+
+from .config import SCORING_RULES_FILE
+
+logger = logging.getLogger(__name__)
+
+RULE_SECTIONS = frozenset({"score_weights", "remote_reject_phrases"})
+
+
+class Ruleset(NamedTuple):
+    """Compiled scoring rules. Immutable; compare rulesets by ``digest``."""
+    weights: Tuple[Tuple[str, int], ...]
+    reject_phrases: Tuple[str, ...]
+    reject_pattern: Optional[Pattern]
+    digest: str
+    word_weights: Tuple[Tuple[Pattern, int], ...] = ()
+    word_reject_pattern: Optional[Pattern] = None
+
+    def score(self, text: str) -> int:
+        """Score lowercase ``text``; 0 if any remote-reject phrase is present."""
+        if self.reject_pattern is not None and self.reject_pattern.search(text):
+            return 0
+        return sum(weight for keyword, weight in self.weights if keyword in text)
+
+    def score_page(self, text: str, reject_text: str = "") -> int:
+        """
+        Score lowercase full-page ``text`` by whole-word matches.
+
+        Remote-reject phrases are only looked for in ``reject_text`` (the
+        posting body), so navigation and sidebars can't reject a job.
+        """
+        if self.word_reject_pattern is not None and self.word_reject_pattern.search(reject_text):
+            return 0
+        return sum(weight for pattern, weight in self.word_weights if pattern.search(text))
+
+
+def _word_regex(keyword: str) -> str:
+    """Whole-word regex for a keyword; plurals ("llms") and "€150k" still match."""
+    start = r"(?<!\w)" if keyword[:1].isalnum() else ""
+    if keyword[-1:].isalpha():
+        end = r"s?(?![^\W\d_])"
+    elif keyword[-1:].isdigit():
+        end = r"(?!\d)"
+    else:
+        end = ""
+    return start + re.escape(keyword) + end
+
+
+def _flatten(section, kind) -> list:
+    """Accept a flat dict/list or one level of named groups."""
+    if isinstance(section, list):
+        return list(section)
+    if isinstance(section, dict):
+        if all(isinstance(v, (dict, list)) for v in section.values()):
+            items = []
+            for group in section.values():
+                items.extend(group.items() if isinstance(group, dict) else group)
+            return items
+        return list(section.items())
+    raise ValueError(f"{kind} must be a list or object, got {type(section).__name__}")
+
+
+def compile_rules(data: Dict) -> Ruleset:
+    """
+    Validate and compile a parsed rules document.
+
+    Raises ValueError on unknown top-level keys, missing or empty
+    ``score_weights``, non-integer weights and duplicate keywords, so a
+    typo never hot-reloads as an empty ruleset that scores everything 0.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"rules must be an object, got {type(data).__name__}")
+    unknown = set(data) - RULE_SECTIONS
+    if unknown:
+        raise ValueError(f"unknown rules section(s): {', '.join(sorted(unknown))}")
+
+    weights: Dict[str, int] = {}
+    for keyword, weight in _flatten(data.get("score_weights", {}), "score_weights"):
+        if not isinstance(weight, int) or isinstance(weight, bool):
+            raise ValueError(f"weight for {keyword!r} must be an integer")
+        keyword = str(keyword).lower()
+        if keyword in weights:
+            raise ValueError(f"duplicate keyword {keyword!r} in score_weights")
+        weights[keyword] = weight
+    if not weights:
+        raise ValueError("score_weights is missing or empty")
+
+    phrases = sorted({str(p).lower() for p in
+                      _flatten(data.get("remote_reject_phrases", []), "remote_reject_phrases")})
+
+    canonical = json.dumps({"score_weights": weights, "remote_reject_phrases": phrases},
+                           sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+    return Ruleset(
+        weights=tuple(sorted(weights.items())),
+        reject_phrases=tuple(phrases),
+        reject_pattern=re.compile("|".join(map(re.escape, phrases))) if phrases else None,
+        digest=digest,
+        word_weights=tuple((re.compile(_word_regex(keyword)), weight)
+                           for keyword, weight in sorted(weights.items())),
+        word_reject_pattern=(re.compile("|".join(map(_word_regex, phrases)))
+                             if phrases else None),
+    )
+
+
+def load_rules(path: Path) -> Ruleset:
+    """Read and compile a rules file."""
+    with open(path, encoding="utf-8") as f:
+        return compile_rules(json.load(f))
+
+
+class RulesLoader:
+    """Serves the current ruleset, recompiling when the rules file changes."""
+
+    def __init__(self, path: Path = SCORING_RULES_FILE):
+        self.path = Path(path)
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._ruleset: Optional[Ruleset] = None
+
+    def get(self) -> Ruleset:
+        try:
+            st = os.stat(self.path)
+        except OSError as e:
+            if self._ruleset is None:
+                raise FileNotFoundError(f"Scoring rules not found: {self.path}") from e
+            return self._ruleset
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._stamp:
+            try:
+                ruleset = load_rules(self.path)
+            except (ValueError, OSError) as e:  # JSONDecodeError is a ValueError
+                if self._ruleset is None:
+                    raise
+                logger.warning(f"Invalid scoring rules in {self.path}: {e}. "
+                               f"Keeping ruleset {self._ruleset.digest}.")
+                self._stamp = stamp
+                return self._ruleset
+            if self._ruleset is not None and ruleset.digest != self._ruleset.digest:
+                logger.info(f"Reloaded scoring rules: {self._ruleset.digest} → {ruleset.digest}")
+            self._ruleset = ruleset
+            self._stamp = stamp
+        return self._ruleset
+
+
+_loader = RulesLoader()
+
+
+def current_ruleset() -> Ruleset:
+    """The ruleset compiled from the configured rules file."""
+    return _loader.get()
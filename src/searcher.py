@@ -2,19 +2,22 @@
 
 import logging
 import time
-from typing import List, Dict
+from typing import List, Dict, TYPE_CHECKING
 
 import requests
 
 from .config import BRAVE_API_KEY, BRAVE_ENDPOINT, MAX_RESULTS_PER_QUERY, FRESHNESS
 
+if TYPE_CHECKING:
+    from .usage import UsageLedger
+
 logger = logging.getLogger(__name__)
 
 
 class BraveSearcher:
     """Fetches search results from Brave Search API."""
 
-    def __init__(self):
+    def __init__(self, ledger: "UsageLedger" = None):
         if not BRAVE_API_KEY:
             raise ValueError("BRAVE_API_KEY not set. Add it to .env or environment.")
         self.headers = {
@@ -22,13 +25,14 @@ class BraveSearcher:
             "Accept-Encoding": "gzip",
             "X-Subscription-Token": BRAVE_API_KEY,
         }
+        self.ledger = ledger
 
     def search(self, query: str, count: int = None, freshness: str = None) -> List[Dict]:
         """
         Execute a single search query.
 
         Returns list of raw result dicts with keys:
-            title, url, description
+            title, url, description, query
         """
         params = {
             "q": query,
@@ -41,6 +45,9 @@ class BraveSearcher:
         elif FRESHNESS:
             params["freshness"] = FRESHNESS
 
+        status = 0
+        results = []
+        started = time.perf_counter()
         try:
             resp = requests.get(
                 BRAVE_ENDPOINT,
@@ -48,15 +55,16 @@ class BraveSearcher:
                 params=params,
                 timeout=15,
             )
+            status = resp.status_code
             resp.raise_for_status()
             data = resp.json()
 
-            results = []
             for item in data.get("web", {}).get("results", []):
                 results.append({
                     "title": item.get("title", ""),
                     "url": item.get("url", ""),
                     "description": item.get("description", ""),
+                    "query": query,
                 })
             logger.info(f"Query returned {len(results)} results: {query[:60]}...")
             return results
@@ -67,6 +75,10 @@ class BraveSearcher:
         except Exception as e:
             logger.error(f"Search failed for query '{query[:40]}': {e}")
             return []
+        finally:
+            if self.ledger is not None:
+                latency_ms = (time.perf_counter() - started) * 1000
+                self.ledger.record_call(query, status, latency_ms, len(results))
 
     def search_all(self, queries: List[str], delay: float = 1.1) -> List[Dict]:
         """
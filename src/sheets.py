@@ -10,10 +10,10 @@ from .config import GOG_ACCOUNT, SHEET_OWNER_EMAIL
 logger = logging.getLogger(__name__)
 
 COLUMNS = ["date_found", "score", "title", "company", "location",
-           "salary", "source", "status", "url", "description"]
+           "salary", "source", "status", "url", "description", "ruleset"]
 
 HEADER = ["Date Found", "Score", "Title", "Company", "Location",
-          "Salary", "Source", "Status", "URL", "Description"]
+          "Salary", "Source", "Status", "URL", "Description", "Ruleset"]
 
 
 class SheetsWriter:
@@ -49,7 +49,7 @@ class SheetsWriter:
         logger.info(f"Shared with {SHEET_OWNER_EMAIL}")
 
         # Write header row
-        self._write_row(sheet_id, "Sheet1!A1:J1", [HEADER])
+        self._write_row(sheet_id, "Sheet1!A1:K1", [HEADER])
         self.sheet_id = sheet_id
         return sheet_id
 
@@ -68,7 +68,7 @@ class SheetsWriter:
         for job in jobs:
             row_values = "|".join(str(job.get(col, "")).replace("|", " ") for col in COLUMNS)
             self._gog([
-                "sheets", "append", self.sheet_id, "Sheet1!A:J",
+                "sheets", "append", self.sheet_id, "Sheet1!A:K",
                 row_values,
                 f"--account={GOG_ACCOUNT}",
                 "--input=USER_ENTERED",
@@ -0,0 +1,236 @@
+"""Usage ledger — records every Brave API call and enforces the call budget.
+
+Append-only JSONL with three kinds of rows, joined by ``run_id``:
+
+    {"type": "call",  "run_id", "ts", "query", "status", "latency_ms", "results"}
+    {"type": "yield", "run_id", "ts", "query", "results", "new_jobs"}
+    {"type": "run",   "run_id", "ts", "results", "new_jobs",
+     "boards": {"Himalayas": {"results": 7, "new_jobs": 2}, ...}}
+
+Call rows are written as each request finishes, so the budget stays
+accurate even if a run dies part-way. Yield and run rows are written once
+the deduplicator knows which URLs were new. A URL returned by several
+queries counts once per query in the yield rows (the by-query table) but
+only once in the run row, which the overall and per-board totals use.
+"""
+
+import json
+import logging
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+from .config import (
+    USAGE_LEDGER_FILE, BRAVE_DAILY_LIMIT, BRAVE_MONTHLY_LIMIT, BRAVE_COST_PER_1K,
+)
+from .classifier import classify_url
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class UsageLedger:
+    """Persistent record of Brave API calls, their yield, and the budget left."""
+
+    def __init__(self, ledger_file: Path = USAGE_LEDGER_FILE,
+                 daily_limit: int = BRAVE_DAILY_LIMIT,
+                 monthly_limit: int = BRAVE_MONTHLY_LIMIT,
+                 cost_per_1k: float = BRAVE_COST_PER_1K):
+        self.ledger_file = ledger_file
+        self.daily_limit = daily_limit
+        self.monthly_limit = monthly_limit
+        self.cost_per_1k = cost_per_1k
+        self.run_id = uuid.uuid4().hex[:12]
+
+    # ── Recording ─────────────────────────────────────────────────────────────
+
+    def record_call(self, query: str, status: int, latency_ms: float, results: int):
+        """Record one API request (status 0 = no HTTP response)."""
+        self._append({
+            "type": "call", "run_id": self.run_id, "ts": _now().isoformat(timespec="seconds"),
+            "query": query, "status": status, "latency_ms": round(latency_ms, 1),
+            "results": results,
+        })
+
+    def record_yield(self, raw_results: List[Dict], new_urls: Set[str]):
+        """Record this run's results and new jobs, per query and as distinct URLs by board."""
+        urls_by_query: Dict[str, Set[str]] = defaultdict(set)
+        for raw in raw_results:
+            url = raw.get("url", "").strip()
+            if url:
+                urls_by_query[raw.get("query", "")].add(url)
+
+        ts = _now().isoformat(timespec="seconds")
+        for query, urls in urls_by_query.items():
+            self._append({
+                "type": "yield", "run_id": self.run_id, "ts": ts, "query": query,
+                "results": len(urls), "new_jobs": len(urls & new_urls),
+            })
+
+        all_urls = set().union(*urls_by_query.values())
+        boards: Dict[str, Dict] = defaultdict(lambda: {"results": 0, "new_jobs": 0})
+        for url in all_urls:
+            board = boards[classify_url(url).source]
+            board["results"] += 1
+            board["new_jobs"] += url in new_urls
+        self._append({
+            "type": "run", "run_id": self.run_id, "ts": ts,
+            "results": len(all_urls), "new_jobs": len(all_urls & new_urls),
+            "boards": {name: dict(counts) for name, counts in boards.items()},
+        })
+
+    # ── Budget ────────────────────────────────────────────────────────────────
+
+    def calls_used(self, now: datetime = None) -> Dict[str, int]:
+        """Calls made today and this calendar month (UTC)."""
+        now = now or _now()
+        day, month = now.strftime("%Y-%m-%d"), now.strftime("%Y-%m")
+        used = {"day": 0, "month": 0}
+        for row in self._rows("call"):
+            ts = row.get("ts", "")
+            if ts.startswith(month):
+                used["month"] += 1
+                if ts.startswith(day):
+                    used["day"] += 1
+        return used
+
+    def remaining_calls(self, now: datetime = None) -> Optional[int]:
+        """Calls still allowed under the daily/monthly limits; None if uncapped."""
+        used = self.calls_used(now)
+        remaining = []
+        if self.daily_limit > 0:
+            remaining.append(self.daily_limit - used["day"])
+        if self.monthly_limit > 0:
+            remaining.append(self.monthly_limit - used["month"])
+        return max(min(remaining), 0) if remaining else None
+
+    def cap_queries(self, queries: List[str], now: datetime = None) -> List[str]:
+        """Trim the query list to the remaining budget (earlier queries win)."""
+        remaining = self.remaining_calls(now)
+        if remaining is None or remaining >= len(queries):
+            return list(queries)
+        logger.warning(f"Brave budget: {remaining} call(s) left "
+                       f"(daily={self.daily_limit or '∞'}, monthly={self.monthly_limit or '∞'}) "
+                       f"— running {remaining}/{len(queries)} queries")
+        return list(queries[:remaining])
+
+    # ── Reporting ─────────────────────────────────────────────────────────────
+
+    def report(self, since: str = "") -> Dict:
+        """
+        Aggregate calls, cost and new-job yield by query and by board.
+
+        ``since`` is an ISO date prefix filter (e.g. "2026-10"); empty = all time.
+        Overall and per-board new-job counts use distinct URLs per run; a
+        run's cost is split across boards by their share of its results.
+        """
+        price = self.cost_per_1k / 1000
+        by_query: Dict[str, Dict] = defaultdict(
+            lambda: {"calls": 0, "errors": 0, "latency_ms": 0.0, "results": 0, "new_jobs": 0})
+        calls_by_run: Dict[str, int] = defaultdict(int)
+        runs: List[Dict] = []
+
+        for row in self._rows():
+            if row.get("ts", "") < since:
+                continue
+            if row["type"] == "call":
+                q = by_query[row["query"]]
+                q["calls"] += 1
+                q["errors"] += row.get("status") != 200
+                q["latency_ms"] += row.get("latency_ms", 0)
+                calls_by_run[row.get("run_id", "")] += 1
+            elif row["type"] == "yield":
+                q = by_query[row["query"]]
+                q["results"] += row.get("results", 0)
+                q["new_jobs"] += row.get("new_jobs", 0)
+            elif row["type"] == "run":
+                runs.append(row)
+
+        for q in by_query.values():
+            q["cost"] = q["calls"] * price
+            q["avg_latency_ms"] = q.pop("latency_ms") / q["calls"] if q["calls"] else 0.0
+            q["cost_per_new_job"] = q["cost"] / q["new_jobs"] if q["new_jobs"] else None
+
+        by_board: Dict[str, Dict] = defaultdict(lambda: {"results": 0, "new_jobs": 0, "cost": 0.0})
+        for run in runs:
+            run_cost = calls_by_run.get(run["run_id"], 0) * price
+            for name, counts in run.get("boards", {}).items():
+                board = by_board[name]
+                board["results"] += counts["results"]
+                board["new_jobs"] += counts["new_jobs"]
+                if run.get("results"):
+                    board["cost"] += run_cost * counts["results"] / run["results"]
+        for board in by_board.values():
+            board["cost_per_new_job"] = (board["cost"] / board["new_jobs"]
+                                         if board["new_jobs"] else None)
+
+        calls = sum(q["calls"] for q in by_query.values())
+        new_jobs = sum(run.get("new_jobs", 0) for run in runs)
+        return {
+            "calls": calls,
+            "cost": calls * price,
+            "new_jobs": new_jobs,
+            "cost_per_new_job": calls * price / new_jobs if new_jobs else None,
+            "used": self.calls_used(),
+            "remaining": self.remaining_calls(),
+            "by_query": dict(by_query),
+            "by_board": dict(by_board),
+        }
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _append(self, row: Dict):
+        self.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.ledger_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def _rows(self, kind: str = "") -> Iterator[Dict]:
+        if not self.ledger_file.exists():
+            return
+        with open(self.ledger_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not kind or row.get("type") == kind:
+                    yield row
+
+
+def format_report(report: Dict, daily_limit: int = BRAVE_DAILY_LIMIT,
+                  monthly_limit: int = BRAVE_MONTHLY_LIMIT) -> str:
+    """Render a usage report as fixed-width text."""
+    def money(value):
+        return "—" if value is None else f"${value:.4f}"
+
+    used = report["used"]
+    lines = [
+        f"{'='*80}",
+        f"Brave API usage — {report['calls']} calls, {money(report['cost'])}, "
+        f"{report['new_jobs']} new jobs, {money(report['cost_per_new_job'])}/new job",
+        f"Today: {used['day']}/{daily_limit or '∞'}   "
+        f"This month: {used['month']}/{monthly_limit or '∞'}   "
+        f"Remaining: {'∞' if report['remaining'] is None else report['remaining']}",
+        f"{'='*80}",
+        f"{'CALLS':>5}  {'ERR':>3}  {'NEW':>4}  {'COST':>9}  {'$/NEW':>9}  {'MS':>6}  QUERY",
+    ]
+    for query, q in sorted(report["by_query"].items(),
+                           key=lambda item: item[1]["new_jobs"], reverse=True):
+        lines.append(f"{q['calls']:>5}  {q['errors']:>3}  {q['new_jobs']:>4}  "
+                     f"{money(q['cost']):>9}  {money(q['cost_per_new_job']):>9}  "
+                     f"{q['avg_latency_ms']:>6.0f}  {query[:40]}")
+    lines += [
+        f"{'-'*80}",
+        f"{'RESULTS':>7}  {'NEW':>4}  {'COST':>9}  {'$/NEW':>9}  BOARD",
+    ]
+    for name, b in sorted(report["by_board"].items(),
+                          key=lambda item: item[1]["new_jobs"], reverse=True):
+        lines.append(f"{b['results']:>7}  {b['new_jobs']:>4}  {money(b['cost']):>9}  "
+                     f"{money(b['cost_per_new_job']):>9}  {name}")
+    lines.append(f"{'='*80}")
+    return "\n".join(lines)
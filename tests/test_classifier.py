@@ -0,0 +1,111 @@
+"""Tests for hostname-indexed URL classification."""
+
+import pytest
+from src.classifier import UrlClassifier, classify_url
+
+
+# ── Source ─────────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("url,source", [
+    ("https://www.linkedin.com/jobs/view/123", "LinkedIn"),
+    ("https://uk.linkedin.com/jobs/view/123", "LinkedIn"),
+    ("https://remoteok.com/remote-jobs/remote-senior-ml-engineer-1", "RemoteOK"),
+    ("https://himalayas.app/companies/acme/jobs/ml-engineer", "Himalayas"),
+    ("https://euremotejobs.com/job/senior-ml-engineer/", "EU Remote Jobs"),
+    ("https://wellfound.com/company/acme/jobs/1-ml-engineer", "Wellfound"),
+    ("https://boards.greenhouse.io/acme/jobs/42", "Greenhouse"),
+    ("https://careers.example.com/jobs/42", "Web"),
+])
+def test_source_by_host(url, source):
+    assert classify_url(url).source == source
+
+
+def test_lookalike_host_not_matched():
+    # "notlinkedin.com" must not resolve through the linkedin.com suffix
+    assert classify_url("https://notlinkedin.com/jobs/1").source == "Web"
+
+
+# ── Job / non-job ──────────────────────────────────────────────────────────────
+
+def test_remoteok_category_page_rejected():
+    assert not classify_url("https://remoteok.com/remote-ml-jobs").is_job
+
+
+def test_blocked_domain_rejected():
+    assert not classify_url("https://www.reddit.com/r/MachineLearning/comments/x").is_job
+
+
+def test_board_path_rule_rejected():
+    assert not classify_url("https://www.glassdoor.com/Salaries/ml-engineer.htm").is_job
+
+
+def test_generic_article_on_unknown_host_rejected():
+    assert not classify_url("https://example.com/blog/ml-salary-trends").is_job
+
+
+@pytest.mark.parametrize("url", [
+    "https://euremotejobs.com/blog/ml-salaries-2026",
+    "https://www.linkedin.com/salary/ml-engineer",
+])
+def test_board_article_section_rejected(url):
+    assert not classify_url(url).is_job
+
+
+def test_board_job_with_news_in_slug_kept():
+    url = "https://himalayas.app/companies/newsweek/jobs/senior-ml-engineer-guide-platform"
+    assert classify_url(url).is_job
+    assert classify_url("https://boards.greenhouse.io/news-corp/jobs/42").is_job
+
+
+def test_hacker_news_threads_rejected():
+    assert not classify_url("https://news.ycombinator.com/item?id=41709301").is_job
+    assert classify_url("https://www.ycombinator.com/companies/acme/jobs/1-ml").is_job
+
+
+def test_generic_token_is_whole_word_only():
+    assert classify_url("https://guidewire.example.com/careers/ml-engineer").is_job
+
+
+# ── Company ────────────────────────────────────────────────────────────────────
+
+def test_company_from_path():
+    assert classify_url("https://himalayas.app/companies/deep-mind/jobs/x").company == "Deep Mind"
+    assert classify_url("https://jobs.lever.co/acme/3f2a-11").company == "Acme"
+
+
+def test_company_from_linkedin_slug():
+    url = "https://www.linkedin.com/jobs/view/senior-ml-engineer-at-acme-corp-3812345678"
+    assert classify_url(url).company == "Acme Corp"
+
+
+def test_company_from_title_fallback():
+    assert classify_url("https://remoteok.com/remote-jobs/x-1",
+                        "Acme is hiring a Senior ML Engineer").company == "Acme"
+    assert classify_url("https://example.com/jobs/1",
+                        "Senior ML Engineer at Acme - Remote").company == "Acme"
+    assert classify_url("https://example.com/jobs/1", "We're hiring ML engineers").company == ""
+
+
+@pytest.mark.parametrize("title,company", [
+    ("Senior ML Engineer - Acme is hiring", "Acme"),
+    ("Senior ML Engineer, Acme hiring now", "Acme"),
+    ("Senior ML Engineer at Remote-first startup", ""),
+    ("Senior Engineer at AI startup", ""),
+    ("Remote jobs at Himalayas", ""),
+    ("Senior ML Engineer at RemoteOK", ""),
+    ("Senior Engineer Hiring Remote", ""),
+    ("Machine Learning Engineer at Hugging-Face", "Hugging-Face"),
+    ("Join us at Europe's fastest ML team", ""),
+    ("Staff ML Engineer | Acme hiring", "Acme"),
+])
+def test_company_title_fallback_rejects_guesses(title, company):
+    assert classify_url("https://example.com/jobs/1", title).company == company
+
+
+# ── Memoization ────────────────────────────────────────────────────────────────
+
+def test_host_rule_memoized():
+    c = UrlClassifier()
+    first = c.rule_for_host("boards.greenhouse.io")
+    assert c.rule_for_host("boards.greenhouse.io") is first
+    assert first.source == "Greenhouse"
@@ -0,0 +1,244 @@
+"""Tests for full-page enrichment against a local HTTP stub server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from src.enricher import PageFetcher, enrich_jobs, extract_page
+
+
+PAGES = {
+    "/remote": b"""<html><head><title>x</title><script>var hybrid = 1;</script></head>
+        <body><nav>Jobs | Hybrid roles | Blog</nav>
+        <main><h1>Senior ML Engineer</h1><p>Fully remote across Europe.</p>
+        <p>Compensation: &euro;120k - &euro;150k. LLM, RAG, AWS.</p></main></body></html>""",
+    "/hybrid": b"""<html><body><main><h1>Senior ML Engineer</h1>
+        <p>This is a hybrid role, 3 days in office.</p></main></body></html>""",
+    "/slow": b"<html><body><p>Senior ML Engineer, remote</p></body></html>",
+    # Realistic noise: "intern"/"rag" inside other words, "hybrid" outside the posting body
+    "/platform": b"""<html><body><nav>Remote | Hybrid | Internships</nav>
+        <main><h1>Senior ML Engineer (Remote, EU)</h1>
+        <p>You will build internal tools for an international team, from storage
+        to model serving, and leverage our LLM platform.</p></main>
+        <aside><h3>Also on our blog</h3><p>How we run hybrid cloud infrastructure</p></aside>
+        </body></html>""",
+    "/no-main": b"""<html><body><div class="menu">Remote jobs | Hybrid jobs | On-site jobs</div>
+        <div><h1>Senior ML Engineer</h1><p>Fully remote. LLM, RAG, AWS.</p></div>
+        </body></html>""",
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    etag = '"v1"'
+    full_responses = 0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            path = self.path.split("?")[0]
+            if path.startswith("/slow"):
+                time.sleep(0.05)
+                path = "/slow"
+            if path not in PAGES:
+                self.send_response(404)
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match") == cls.etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = PAGES[path]
+            with cls.lock:
+                cls.full_responses += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", cls.etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    StubHandler.full_responses = 0
+    StubHandler.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01},
+                              daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    return PageFetcher(cache_file=tmp_path / "page_cache.json")
+
+
+def make_job(url, score=30):
+    return {"title": "Senior ML Engineer", "url": url, "score": score,
+            "salary": "", "location": "Unknown", "query_hits": 1}
+
+
+# ── Text extraction ────────────────────────────────────────────────────────────
+
+def test_extract_page_prefers_main_and_skips_scripts():
+    text, main = extract_page([PAGES["/remote"][:60], PAGES["/remote"][60:]])
+    assert "Fully remote across Europe." in text
+    assert "€120k - €150k" in text
+    assert "hybrid" not in text.lower()
+    assert main.startswith("Senior ML Engineer")
+
+
+def test_extract_page_main_text_excludes_sidebar():
+    text, main = extract_page([PAGES["/platform"]])
+    assert "hybrid cloud" in text
+    assert "internal tools" in main and "hybrid" not in main.lower()
+    assert extract_page([PAGES["/no-main"]])[1] == ""
+
+
+def test_extract_page_capped():
+    html = b"<p>" + b"word " * 10000 + b"</p>"
+    assert len(extract_page([html], max_chars=100)[0]) <= 100
+
+
+def test_extract_page_stops_reading_without_main():
+    read = []
+
+    def chunks():
+        for _ in range(1000):
+            read.append(1)
+            yield b"<div><p>" + b"word " * 200 + b"</p></div>"
+
+    text, main = extract_page(chunks(), max_chars=5000)
+    assert len(text) <= 5000 and main == ""
+    assert len(read) < 10
+
+
+# ── Fetching ───────────────────────────────────────────────────────────────────
+
+def test_conditional_get_uses_cache(stub_server, tmp_path):
+    url = f"{stub_server}/remote"
+    first = PageFetcher(cache_file=tmp_path / "cache.json").fetch_all([url])
+    second_fetcher = PageFetcher(cache_file=tmp_path / "cache.json")
+    second = second_fetcher.fetch_all([url])
+
+    assert first[url] == second[url]
+    assert StubHandler.full_responses == 1
+    assert second_fetcher.not_modified == 1
+
+
+def test_expired_cache_entries_pruned(stub_server, tmp_path):
+    cache = tmp_path / "cache.json"
+    cache.write_text(json.dumps({
+        "https://old.example/job": {"etag": "x", "last_modified": "", "text": "old",
+                                    "fetched": "2000-01-01"},
+    }))
+    url = f"{stub_server}/remote"
+    PageFetcher(cache_file=cache).fetch_all([url])
+    assert list(json.loads(cache.read_text())) == [url]
+
+
+def test_not_modified_refreshes_fetched_date(stub_server, tmp_path):
+    cache = tmp_path / "cache.json"
+    url = f"{stub_server}/remote"
+    PageFetcher(cache_file=cache).fetch_all([url])
+    data = json.loads(cache.read_text())
+    data[url]["fetched"] = "2000-01-01"
+    cache.write_text(json.dumps(data))
+
+    PageFetcher(cache_file=cache).fetch_all([url])  # 304 → entry kept, date refreshed
+    assert json.loads(cache.read_text())[url]["fetched"] != "2000-01-01"
+
+
+def test_per_host_limit(stub_server, tmp_path):
+    urls = [f"{stub_server}/slow?{i}" for i in range(8)]
+    f = PageFetcher(cache_file=tmp_path / "cache.json", concurrency=8, per_host=2)
+    texts = f.fetch_all(urls)
+    assert len(texts) == 8
+    assert StubHandler.max_in_flight <= 2
+
+
+def test_missing_page_omitted(stub_server, fetcher):
+    assert fetcher.fetch_all([f"{stub_server}/gone"]) == {}
+
+
+# ── Rescoring ──────────────────────────────────────────────────────────────────
+
+def test_enrich_rescores_and_extracts_salary(stub_server, fetcher):
+    job = make_job(f"{stub_server}/remote")
+    enrich_jobs([job], fetcher)
+    assert job["enriched"]
+    assert "€120k" in job["salary"]
+    assert job["score"] > 30
+
+
+def test_enrich_rejects_hybrid_in_full_text(stub_server, fetcher):
+    job = make_job(f"{stub_server}/hybrid")
+    enrich_jobs([job], fetcher)
+    assert job["score"] == 0
+
+
+def test_enrich_ignores_substring_and_off_body_hits(stub_server, fetcher):
+    job = make_job(f"{stub_server}/platform")
+    enrich_jobs([job], fetcher)
+    # senior + ml engineer + llm + model serving + remote + eu; no "intern", "rag" or "hybrid"
+    assert job["score"] == 10 + 20 + 12 + 10 + 8 + 5
+
+
+def test_enrich_without_main_skips_reject_phrases(stub_server, fetcher):
+    job = make_job(f"{stub_server}/no-main")
+    enrich_jobs([job], fetcher)
+    assert job["score"] > 0
+
+
+def test_enrich_keeps_snippet_score_on_failure(stub_server, fetcher):
+    job = make_job(f"{stub_server}/gone", score=42)
+    enrich_jobs([job], fetcher)
+    assert job["score"] == 42
+    assert "enriched" not in job
+
+
+# ── Pipeline integration ───────────────────────────────────────────────────────
+
+def test_run_enriches_at_most_enrich_top_n(tmp_path, monkeypatch):
+    pytest.importorskip("requests")
+    from src import enricher, main, searcher
+
+    raw = [{"title": f"Senior ML Engineer {i}", "description": "Remote EU machine learning",
+            "url": f"https://himalayas.app/companies/acme/jobs/{i}", "query": "q1"}
+           for i in range(5)]
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "BRAVE_API_KEY", "test-key")
+    monkeypatch.setattr(main, "ENRICH_TOP_N", 2)
+    monkeypatch.setattr(searcher, "BRAVE_API_KEY", "test-key")
+    monkeypatch.setattr(searcher.BraveSearcher, "search_all", lambda self, queries: raw)
+
+    fetched = []
+
+    def fake_enrich(jobs):
+        fetched.extend(jobs)
+        for job in jobs:
+            job["score"] += 100
+        return jobs
+
+    monkeypatch.setattr(enricher, "enrich_jobs", fake_enrich)
+    jobs = main.run(dry_run=True, top_n=4, enrich=True)
+    assert len(fetched) == 2
+    assert len(jobs) == 4
+    assert [j["score"] > 100 for j in jobs] == [True, True, False, False]
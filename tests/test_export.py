@@ -0,0 +1,200 @@
+"""Tests for job history recording and columnar export."""
+
+import gzip
+import json
+
+import pytest
+from src.export import EXPORT_SCHEMA, HistoryExporter
+from src.history import JobHistory
+
+
+def make_jobs(n, start=0):
+    return [{"url": f"https://a.com/{i}", "title": f"Job {i}", "score": 40 + i,
+             "source": "Web", "query_hits": "2"} for i in range(start, start + n)]
+
+
+@pytest.fixture
+def history(tmp_path):
+    return JobHistory(history_file=tmp_path / "job_history.jsonl")
+
+
+def exporter(history, tmp_path, **kwargs):
+    return HistoryExporter(history=history, out_dir=tmp_path / "exports", fmt="jsonl",
+                           compression="gzip", **kwargs)
+
+
+def read_rows(out_dir):
+    """Rebuild rows from every columnar JSONL part, in part order."""
+    rows = []
+    for path in sorted(out_dir.glob("jobs-part-*.jsonl.gz")):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                chunk = json.loads(line)
+                rows.extend(dict(zip(chunk, values)) for values in zip(*chunk.values()))
+    return rows
+
+
+# ── History ────────────────────────────────────────────────────────────────────
+
+def test_history_append_and_stream(history):
+    history.append(make_jobs(3))
+    rows = [row for _, row in history.iter_from(0)]
+    assert [r["url"] for r in rows] == ["https://a.com/0", "https://a.com/1", "https://a.com/2"]
+    assert all("recorded_at" in r for r in rows)
+
+
+def test_history_ignores_partial_trailing_line(history):
+    history.append(make_jobs(1))
+    with open(history.history_file, "a") as f:
+        f.write('{"url": "half')
+    assert len(list(history.iter_from(0))) == 1
+
+
+# ── Export ─────────────────────────────────────────────────────────────────────
+
+def test_full_export_columnar_chunks(history, tmp_path):
+    history.append(make_jobs(25))
+    result = exporter(history, tmp_path, chunk_rows=10).export()
+
+    assert result["rows"] == 25
+    part = tmp_path / "exports" / result["files"][0]
+    with gzip.open(part, "rt") as f:
+        chunks = [json.loads(line) for line in f]
+    assert [len(c["url"]) for c in chunks] == [10, 10, 5]
+    assert list(chunks[0]) == [name for name, _ in EXPORT_SCHEMA]
+    assert chunks[0]["query_hits"][0] == 2  # coerced to int
+    assert chunks[0]["enriched"][0] is False
+
+
+def test_parts_roll_over(history, tmp_path):
+    history.append(make_jobs(25))
+    result = exporter(history, tmp_path, chunk_rows=5, part_rows=10).export()
+    assert len(result["files"]) == 3
+    assert len(read_rows(tmp_path / "exports")) == 25
+
+
+def test_incremental_appends_only_new_rows(history, tmp_path):
+    history.append(make_jobs(5))
+    exporter(history, tmp_path).export(incremental=True)
+
+    history.append(make_jobs(3, start=5))
+    result = exporter(history, tmp_path).export(incremental=True)
+    assert result["rows"] == 3
+    assert result["files"] == ["jobs-part-00001.jsonl.gz"]
+
+    rows = read_rows(tmp_path / "exports")
+    assert [r["url"] for r in rows] == [f"https://a.com/{i}" for i in range(8)]
+
+    watermark = json.loads((tmp_path / "exports" / "_watermark.json").read_text())
+    assert watermark["rows"] == 8
+    assert watermark["offset"] == history.size()
+
+
+def test_incremental_noop_when_nothing_new(history, tmp_path):
+    history.append(make_jobs(2))
+    exporter(history, tmp_path).export(incremental=True)
+    result = exporter(history, tmp_path).export(incremental=True)
+    assert result["rows"] == 0 and result["files"] == []
+
+
+def test_full_export_replaces_previous_parts(history, tmp_path):
+    history.append(make_jobs(4))
+    exporter(history, tmp_path).export(incremental=True)
+    history.append(make_jobs(1, start=4))
+    exporter(history, tmp_path).export(incremental=True)
+
+    exporter(history, tmp_path).export()
+    assert len(list((tmp_path / "exports").glob("jobs-part-*"))) == 1
+    assert len(read_rows(tmp_path / "exports")) == 5
+
+
+def test_incremental_after_layout_change_does_full_export(history, tmp_path):
+    history.append(make_jobs(4))
+    exporter(history, tmp_path).export(incremental=True)
+    watermark_file = tmp_path / "exports" / "_watermark.json"
+    watermark = json.loads(watermark_file.read_text())
+    assert (watermark["format"], watermark["compression"]) == ("jsonl", "gzip")
+
+    # Simulate parts written by an earlier zstd export
+    watermark_file.write_text(json.dumps({**watermark, "compression": "zstd"}))
+    (tmp_path / "exports" / "jobs-part-00000.jsonl.zst").write_bytes(b"")
+    history.append(make_jobs(1, start=4))
+    result = exporter(history, tmp_path).export(incremental=True)
+
+    assert result["rows"] == 5
+    assert [p.name for p in (tmp_path / "exports").glob("jobs-part-*")] == \
+        ["jobs-part-00000.jsonl.gz"]
+
+
+def test_zstd_jsonl_export(history, tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    history.append(make_jobs(12))
+    out = tmp_path / "exports"
+    result = HistoryExporter(history=history, out_dir=out, fmt="jsonl",
+                             compression="zstd", chunk_rows=5).export()
+
+    assert result["files"] == ["jobs-part-00000.jsonl.zst"]
+    with open(out / result["files"][0], "rb") as f:
+        text = zstandard.ZstdDecompressor().stream_reader(f).read().decode("utf-8")
+    chunks = [json.loads(line) for line in text.splitlines()]
+    assert [len(c["url"]) for c in chunks] == [5, 5, 2]
+    assert chunks[0]["score"][:2] == [40, 41]
+
+
+def test_parquet_export_row_groups_and_incremental(history, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    history.append(make_jobs(12))
+    out = tmp_path / "exports"
+
+    def export(**kwargs):
+        return HistoryExporter(history=history, out_dir=out, fmt="parquet",
+                               chunk_rows=5).export(**kwargs)
+
+    result = export(incremental=True)
+    assert result["format"] == "parquet"
+    part = pq.ParquetFile(out / result["files"][0])
+    assert part.metadata.num_row_groups == 3
+    table = part.read()
+    assert table.column_names == [name for name, _ in EXPORT_SCHEMA]
+    assert table.column("query_hits").to_pylist()[0] == 2
+
+    history.append(make_jobs(2, start=12))
+    assert export(incremental=True)["files"] == ["jobs-part-00001.parquet"]
+    total = sum(pq.ParquetFile(p).metadata.num_rows for p in out.glob("jobs-part-*.parquet"))
+    assert total == 14
+
+
+def test_unknown_format_rejected(history, tmp_path):
+    with pytest.raises(ValueError):
+        HistoryExporter(history=history, out_dir=tmp_path, fmt="csv")
+
+
+# ── Pipeline integration ───────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("dry_run,recorded", [(True, False), (False, True)])
+def test_history_recorded_only_on_real_runs(tmp_path, monkeypatch, dry_run, recorded):
+    pytest.importorskip("requests")
+    from src import main, searcher
+
+    raw = [{"title": "Senior ML Engineer", "description": "Remote EU €150k machine learning",
+            "url": "https://himalayas.app/companies/acme/jobs/1", "query": "q1"}]
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "BRAVE_API_KEY", "test-key")
+    monkeypatch.setattr(searcher, "BRAVE_API_KEY", "test-key")
+    monkeypatch.setattr(searcher.BraveSearcher, "search_all", lambda self, queries: raw)
+
+    class FakeWriter:
+        sheet_id = "sheet"
+
+        def __init__(self, sheet_id=""):
+            pass
+
+        def append_jobs(self, jobs):
+            return len(jobs)
+
+        def sheet_url(self):
+            return "https://example.com/sheet"
+
+    monkeypatch.setattr("src.sheets.SheetsWriter", FakeWriter)
+    assert len(main.run(dry_run=dry_run)) == 1
+    assert (tmp_path / "data" / "job_history.jsonl").exists() == recorded
@@ -0,0 +1,80 @@
+"""Tests for cross-query result memoization."""
+
+import json
+from unittest import mock
+
+import pytest
+from src import memo as memo_module
+from src.memo import ResultMemo, content_hash, query_hit_bonus
+
+
+def make_raw(url, title="Senior ML Engineer", description="Remote EU €150k machine learning",
+             query="q1"):
+    return {"title": title, "url": url, "description": description, "query": query}
+
+
+@pytest.fixture
+def tmp_memo(tmp_path):
+    """Temporary memo state file path."""
+    return tmp_path / "parse_memo.json"
+
+
+def test_duplicates_parsed_once(tmp_memo):
+    raw = [make_raw("https://a.com/1", query=q) for q in ("q1", "q2", "q3")]
+    m = ResultMemo(state_file=tmp_memo)
+    with mock.patch.object(memo_module, "parse_result",
+                           wraps=memo_module.parse_result) as spy:
+        jobs = m.parse(raw)
+    assert spy.call_count == 1
+    assert len(jobs) == 1
+
+
+def test_query_hits_and_bonus(tmp_memo):
+    single = ResultMemo(state_file=tmp_memo).parse([make_raw("https://a.com/1")])[0]
+    raw = [make_raw("https://a.com/2", query=q) for q in ("q1", "q2", "q2")]
+    multi = ResultMemo(state_file=tmp_memo).parse(raw)[0]
+    assert single["query_hits"] == 1
+    assert multi["query_hits"] == 2  # same query twice counts once
+    assert multi["score"] == single["score"] + query_hit_bonus(2)
+
+
+def test_bonus_capped():
+    assert query_hit_bonus(1) == 0
+    assert query_hit_bonus(100) == query_hit_bonus(50)
+
+
+def test_memo_persists_across_runs(tmp_memo):
+    ResultMemo(state_file=tmp_memo).parse([make_raw("https://a.com/1")])
+    assert content_hash(make_raw("https://a.com/1")) in json.loads(tmp_memo.read_text())
+
+    m2 = ResultMemo(state_file=tmp_memo)
+    with mock.patch.object(memo_module, "parse_result") as spy:
+        jobs = m2.parse([make_raw("https://a.com/1")])
+    spy.assert_not_called()
+    assert m2.cache_hits == 1
+    assert jobs[0]["url"] == "https://a.com/1"
+
+
+def test_rejected_results_memoized(tmp_memo):
+    raw = [make_raw("https://a.com/php", "PHP Developer", "WordPress plugins")]
+    assert ResultMemo(state_file=tmp_memo).parse(raw) == []
+
+    m2 = ResultMemo(state_file=tmp_memo)
+    assert m2.parse(raw) == []
+    assert m2.cache_hits == 1
+
+
+def test_changed_content_reparsed(tmp_memo):
+    ResultMemo(state_file=tmp_memo).parse([make_raw("https://a.com/1")])
+    m2 = ResultMemo(state_file=tmp_memo)
+    m2.parse([make_raw("https://a.com/1", description="Remote, LLM, RAG, principal")])
+    assert m2.cache_misses == 1
+
+
+def test_parser_change_invalidates_memo(tmp_memo):
+    ResultMemo(state_file=tmp_memo).parse([make_raw("https://a.com/1")])
+
+    m2 = ResultMemo(state_file=tmp_memo)
+    m2.parser_version = "edited-parser"
+    m2.parse([make_raw("https://a.com/1")])
+    assert m2.cache_misses == 1 and m2.rescored == 1
@@ -89,3 +89,11 @@ def test_parse_results_structure():
 
 def test_parse_results_empty():
     assert parse_results([]) == []
+
+
+def test_parse_results_company_and_source():
+    raw = [make_result("Senior ML Engineer", "Remote EU €150k machine learning",
+                       "https://himalayas.app/companies/acme/jobs/senior-ml-engineer")]
+    job = parse_results(raw)[0]
+    assert job["company"] == "Acme"
+    assert job["source"] == "Himalayas"
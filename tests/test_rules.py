@@ -0,0 +1,141 @@
+"""Tests for scoring-rule compilation, hashing and hot reload."""
+
+import json
+import os
+
+import pytest
+from src import memo as memo_module
+from src.memo import ResultMemo
+from src.rules import RulesLoader, compile_rules, current_ruleset
+from src.parser import score_result
+
+
+FLAT = {"score_weights": {"senior": 10, "remote": 8}, "remote_reject_phrases": ["hybrid"]}
+GROUPED = {"score_weights": {"seniority": {"Senior": 10}, "location": {"remote": 8}},
+           "remote_reject_phrases": {"onsite": ["Hybrid"]}}
+
+
+def write_rules(path, data):
+    path.write_text(json.dumps(data))
+    # Bump mtime explicitly so coarse filesystem clocks still register the edit
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+# ── Compilation ────────────────────────────────────────────────────────────────
+
+def test_grouped_and_flat_compile_identically():
+    assert compile_rules(FLAT) == compile_rules(GROUPED)
+
+
+def test_digest_changes_with_weights():
+    tweaked = {**FLAT, "score_weights": {"senior": 11, "remote": 8}}
+    assert compile_rules(FLAT).digest != compile_rules(tweaked).digest
+
+
+def test_ruleset_score_and_reject():
+    rules = compile_rules(FLAT)
+    assert rules.score("senior remote engineer") == 18
+    assert rules.score("senior remote, hybrid 2 days") == 0
+
+
+def test_score_page_matches_whole_words():
+    rules = compile_rules({"score_weights": {"intern": -30, "llm": 12, "€150": 20, "rag": 12},
+                           "remote_reject_phrases": ["hybrid"]})
+    assert rules.score("internal tools for an international team") == -30
+    assert rules.score_page("internal tools for an international team, storage") == 0
+    assert rules.score_page("interns and llms, up to €150k") == -30 + 12 + 20
+    assert rules.score_page("rag pipelines") == 12
+
+
+def test_score_page_rejects_only_in_body():
+    rules = compile_rules(FLAT)
+    assert rules.score_page("senior remote. hybrid cloud", "senior remote role") == 18
+    assert rules.score_page("senior remote", "a hybrid role, 3 days a week") == 0
+
+
+def test_invalid_weight_rejected():
+    with pytest.raises(ValueError):
+        compile_rules({"score_weights": {"senior": "ten"}})
+
+
+@pytest.mark.parametrize("data", [
+    {"score_weight": {"senior": 10}, "remote_reject_phrases": ["hybrid"]},  # typo
+    {"remote_reject_phrases": ["hybrid"]},
+    {"score_weights": {}},
+    {"score_weights": {"seniority": {"senior": 10}, "boost": {"Senior": 99}}},
+])
+def test_malformed_rules_rejected(data):
+    with pytest.raises(ValueError):
+        compile_rules(data)
+
+
+def test_shipped_rules_match_scoring():
+    r = {"title": "Senior ML Engineer", "description": "Remote"}
+    assert score_result(r) == score_result(r, current_ruleset()) > 0
+
+
+# ── Hot reload ─────────────────────────────────────────────────────────────────
+
+def test_reload_on_change(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, FLAT)
+    loader = RulesLoader(path)
+    first = loader.get()
+    assert loader.get() is first  # unchanged file → same compiled object
+
+    write_rules(path, {**FLAT, "score_weights": {"senior": 50}})
+    second = loader.get()
+    assert second.digest != first.digest
+    assert second.score("senior") == 50
+
+
+def test_invalid_edit_keeps_previous_ruleset(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, FLAT)
+    loader = RulesLoader(path)
+    first = loader.get()
+
+    path.write_text("{ not json")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 2_000_000_000))
+    assert loader.get() is first
+
+
+def test_empty_edit_keeps_previous_ruleset(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, FLAT)
+    loader = RulesLoader(path)
+    first = loader.get()
+
+    write_rules(path, {"score_weight": {"senior": 10}})
+    assert loader.get() is first
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        RulesLoader(tmp_path / "missing.json").get()
+
+
+# ── Memo integration ───────────────────────────────────────────────────────────
+
+def test_memo_rescores_only_on_ruleset_change(tmp_path, monkeypatch):
+    state = tmp_path / "parse_memo.json"
+    raw = [{"title": "Senior ML Engineer", "url": "https://a.com/1",
+            "description": "Remote", "query": "q1"}]
+    v1 = compile_rules(FLAT)
+    v2 = compile_rules({**FLAT, "score_weights": {"senior": 30, "remote": 8}})
+
+    monkeypatch.setattr(memo_module, "current_ruleset", lambda: v1)
+    job = ResultMemo(state_file=state).parse(raw)[0]
+    assert job["ruleset"] == v1.digest
+
+    same = ResultMemo(state_file=state)
+    same.parse(raw)
+    assert same.cache_hits == 1 and same.rescored == 0
+
+    monkeypatch.setattr(memo_module, "current_ruleset", lambda: v2)
+    changed = ResultMemo(state_file=state)
+    job = changed.parse(raw)[0]
+    assert changed.rescored == 1
+    assert job["ruleset"] == v2.digest
+    assert job["score"] == 38
@@ -0,0 +1,74 @@
+"""Startup guard — offline CLI commands must stay light and credential-free."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules only the networked / sheet-writing paths may load. python-dotenv is
+# not listed: config loads it whenever a .env exists, which is the normal setup.
+HEAVY_MODULES = ["requests", "asyncio", "urllib.request",
+                 "src.searcher", "src.sheets", "src.enricher"]
+
+# Generous bound for a cold interpreter on a loaded CI box; a regression that
+# pulls requests back into the import graph typically costs far more than this.
+MAX_IMPORT_SECONDS = 0.25
+
+
+def run_python(args, cwd, **kwargs):
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT), "BRAVE_API_KEY": ""}
+    return subprocess.run([sys.executable, *args], cwd=cwd, env=env,
+                          capture_output=True, text=True, timeout=30, **kwargs)
+
+
+def test_import_skips_heavy_modules(tmp_path):
+    code = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        "import src.main\n"
+        "elapsed = time.perf_counter() - t\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+        "print(elapsed)\n"
+    )
+    out = run_python(["-c", code], cwd=tmp_path)
+    assert out.returncode == 0, out.stderr
+    loaded, elapsed = out.stdout.strip().splitlines()
+    assert loaded == "[]"
+    assert float(elapsed) < MAX_IMPORT_SECONDS
+
+
+def test_queries_command(tmp_path):
+    start = time.perf_counter()
+    out = run_python(["-m", "src.main", "queries"], cwd=tmp_path)
+    assert out.returncode == 0, out.stderr
+    assert "site:" in out.stdout
+    assert time.perf_counter() - start < 5  # sanity bound, not a benchmark
+
+
+@pytest.mark.parametrize("args", [["replay"], ["--dry-run"]])
+def test_offline_commands_replay_cached_search(tmp_path, args):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "last_search.json").write_text(json.dumps([{
+        "title": "Senior ML Engineer",
+        "url": "https://himalayas.app/companies/acme/jobs/senior-ml-engineer",
+        "description": "Remote EU €150k machine learning",
+        "query": "q1",
+    }]))
+    out = run_python(["-m", "src.main", *args], cwd=tmp_path)
+    assert out.returncode == 0, out.stderr
+    assert "Senior ML Engineer" in out.stdout
+    # Offline commands leave the seen-URL state and job history untouched
+    assert not (tmp_path / "data" / "seen_urls.json").exists()
+    assert not (tmp_path / "data" / "job_history.jsonl").exists()
+
+
+def test_replay_without_cache_fails_cleanly(tmp_path):
+    out = run_python(["-m", "src.main", "replay"], cwd=tmp_path)
+    assert out.returncode == 1
+    assert "No cached search" in out.stderr
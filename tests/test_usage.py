@@ -0,0 +1,155 @@
+"""Tests for the Brave API usage ledger, budget cap and cost report."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from src.usage import UsageLedger, format_report
+
+NOW = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def ledger_file(tmp_path):
+    """Temporary ledger path."""
+    return tmp_path / "brave_usage.jsonl"
+
+
+def write_calls(path, timestamps):
+    with open(path, "a") as f:
+        for ts in timestamps:
+            f.write(json.dumps({"type": "call", "run_id": "old", "ts": ts, "query": "q",
+                                "status": 200, "latency_ms": 100, "results": 10}) + "\n")
+
+
+# ── Recording ──────────────────────────────────────────────────────────────────
+
+def test_record_call_persisted(ledger_file):
+    ledger = UsageLedger(ledger_file)
+    ledger.record_call("q1", 200, 123.456, 10)
+    row = json.loads(ledger_file.read_text())
+    assert row["type"] == "call" and row["query"] == "q1"
+    assert row["status"] == 200 and row["results"] == 10 and row["latency_ms"] == 123.5
+    assert row["run_id"] == ledger.run_id
+
+
+def test_record_yield_per_query_and_board(ledger_file):
+    ledger = UsageLedger(ledger_file)
+    raw = [
+        {"url": "https://himalayas.app/companies/a/jobs/1", "query": "q1"},
+        {"url": "https://himalayas.app/companies/a/jobs/1", "query": "q1"},  # repeat
+        {"url": "https://remoteok.com/remote-jobs/2", "query": "q1"},
+        {"url": "https://himalayas.app/companies/a/jobs/1", "query": "q2"},
+    ]
+    ledger.record_yield(raw, {"https://himalayas.app/companies/a/jobs/1"})
+    rows = [json.loads(line) for line in ledger_file.read_text().splitlines()]
+    by_query = {r["query"]: r for r in rows if r["type"] == "yield"}
+    assert by_query["q1"]["results"] == 2 and by_query["q1"]["new_jobs"] == 1
+    assert by_query["q2"]["new_jobs"] == 1
+
+    (run,) = [r for r in rows if r["type"] == "run"]
+    assert run["results"] == 2 and run["new_jobs"] == 1
+    assert run["boards"]["Himalayas"] == {"results": 1, "new_jobs": 1}
+    assert run["boards"]["RemoteOK"] == {"results": 1, "new_jobs": 0}
+
+
+# ── Budget ─────────────────────────────────────────────────────────────────────
+
+def test_calls_used_by_day_and_month(ledger_file):
+    write_calls(ledger_file, ["2026-09-30T10:00:00+00:00",
+                              "2026-10-01T10:00:00+00:00",
+                              "2026-10-19T08:00:00+00:00"])
+    assert UsageLedger(ledger_file).calls_used(NOW) == {"day": 1, "month": 2}
+
+
+def test_cap_queries_to_remaining_budget(ledger_file):
+    write_calls(ledger_file, ["2026-10-19T08:00:00+00:00"] * 3)
+    ledger = UsageLedger(ledger_file, daily_limit=5, monthly_limit=100)
+    assert ledger.cap_queries(["a", "b", "c", "d"], NOW) == ["a", "b"]
+
+
+def test_monthly_limit_exhausted(ledger_file):
+    write_calls(ledger_file, ["2026-10-02T08:00:00+00:00"] * 4)
+    ledger = UsageLedger(ledger_file, daily_limit=0, monthly_limit=4)
+    assert ledger.remaining_calls(NOW) == 0
+    assert ledger.cap_queries(["a"], NOW) == []
+
+
+def test_no_limits_means_uncapped(ledger_file):
+    ledger = UsageLedger(ledger_file, daily_limit=0, monthly_limit=0)
+    assert ledger.remaining_calls(NOW) is None
+    assert ledger.cap_queries(["a", "b"], NOW) == ["a", "b"]
+
+
+# ── Report ─────────────────────────────────────────────────────────────────────
+
+def test_report_cost_per_new_job(ledger_file):
+    ledger = UsageLedger(ledger_file, cost_per_1k=4.0)
+    for _ in range(2):
+        ledger.record_call("q1", 200, 100, 2)
+    ledger.record_call("q2", 429, 50, 0)
+    ledger.record_yield(
+        [{"url": "https://himalayas.app/companies/a/jobs/1", "query": "q1"},
+         {"url": "https://remoteok.com/remote-jobs/2", "query": "q1"}],
+        {"https://himalayas.app/companies/a/jobs/1"},
+    )
+
+    report = ledger.report()
+    assert report["calls"] == 3
+    assert report["cost"] == pytest.approx(0.012)
+    q1, q2 = report["by_query"]["q1"], report["by_query"]["q2"]
+    assert q1["cost_per_new_job"] == pytest.approx(0.008)
+    assert q2["errors"] == 1 and q2["cost_per_new_job"] is None
+
+    himalayas = report["by_board"]["Himalayas"]
+    assert himalayas["cost"] == pytest.approx(0.006)  # half of the run's results
+    assert himalayas["cost_per_new_job"] == pytest.approx(0.006)
+
+    text = format_report(report)
+    assert "q1" in text and "Himalayas" in text
+
+
+def test_report_counts_shared_new_url_once(ledger_file):
+    ledger = UsageLedger(ledger_file, cost_per_1k=3.0)
+    url = "https://himalayas.app/companies/a/jobs/1"
+    for query in ("q1", "q2", "q3"):
+        ledger.record_call(query, 200, 100, 1)
+    ledger.record_yield([{"url": url, "query": q} for q in ("q1", "q2", "q3")], {url})
+
+    report = ledger.report()
+    assert report["new_jobs"] == 1
+    assert report["cost_per_new_job"] == pytest.approx(0.009)
+    assert report["by_board"]["Himalayas"]["results"] == 1
+    assert report["by_board"]["Himalayas"]["new_jobs"] == 1
+    assert report["by_board"]["Himalayas"]["cost"] == pytest.approx(0.009)
+    assert all(q["new_jobs"] == 1 for q in report["by_query"].values())
+
+
+def test_report_since_filter(ledger_file):
+    write_calls(ledger_file, ["2026-09-30T10:00:00+00:00", "2026-10-01T10:00:00+00:00"])
+    assert UsageLedger(ledger_file).report(since="2026-10")["calls"] == 1
+
+
+# ── Searcher integration ───────────────────────────────────────────────────────
+
+def test_searcher_records_every_call(ledger_file, monkeypatch):
+    pytest.importorskip("requests")
+    from src import searcher as searcher_module
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"web": {"results": [{"title": "t", "url": "https://a.com/1"}]}}
+
+    monkeypatch.setattr(searcher_module, "BRAVE_API_KEY", "test-key")
+    monkeypatch.setattr(searcher_module.requests, "get", lambda *a, **kw: FakeResponse())
+    ledger = UsageLedger(ledger_file)
+    searcher_module.BraveSearcher(ledger=ledger).search_all(["q1", "q2"], delay=0)
+
+    rows = [json.loads(line) for line in ledger_file.read_text().splitlines()]
+    assert [r["query"] for r in rows] == ["q1", "q2"]
+    assert all(r["results"] == 1 and r["status"] == 200 for r in rows)